@@ -7,8 +7,10 @@ Addresses Article 17 (Quality Management System) and Article 43 (Conformity Asse
 import os
 import json
 import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -20,6 +22,64 @@ except ImportError:
     GENAI_AVAILABLE = False
     genai = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+
+# Static part of the impact-assessment prompt, set as the system instruction of
+# the assessment model; the per-change prompt only carries the change details.
+IMPACT_ASSESSMENT_INSTRUCTIONS = """
+You are an AI system impact assessment expert for EU AI Act compliance.
+Analyze the change request you are given and provide a comprehensive impact assessment.
+
+Provide a detailed impact assessment covering:
+1. Risk Level (critical/high/medium/low/minimal)
+2. Affected Components (list all impacted components)
+3. Affected Users (estimate of user impact)
+4. Performance Impact (expected performance changes)
+5. Compliance Impact (EU AI Act Article 17, 43 implications)
+6. Rollback Complexity (easy/moderate/complex/very complex)
+7. Testing Requirements (specific tests needed)
+8. Dependencies (other systems/changes this depends on)
+9. Recommendations and Risk Mitigation
+
+Format as JSON with these exact keys:
+- risk_level
+- affected_components (array)
+- affected_users
+- performance_impact
+- compliance_impact
+- rollback_complexity
+- testing_requirements (array)
+- dependencies (array)
+- analysis (detailed text)
+- confidence_score (0.0-1.0)
+"""
+
 
 class ChangeStatus(Enum):
     DRAFT = "draft"
@@ -130,9 +190,16 @@ class ChangeManagementSystem:
         api_key = os.getenv("GEMINI_API_KEY")
         if api_key and GENAI_AVAILABLE:
             genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel("gemini-2.0-flash-exp")
+            self.model = genai.GenerativeModel(GEMINI_MODEL)
         else:
             self.model = None
+        
+        self._assessment_model = None
+        self._assessment_model_lock = threading.Lock()
+        
+        # Buffers used while batch_writes() is active; None means write through
+        self._pending_changes: Optional[Dict[str, ChangeRequest]] = None
+        self._pending_log_lines: Optional[List[str]] = None
     
     def create_change_request(
         self,
@@ -185,9 +252,6 @@ class ChangeManagementSystem:
             return self._manual_impact_assessment(change)
         
         prompt = f"""
-You are an AI system impact assessment expert for EU AI Act compliance.
-Analyze this change request and provide a comprehensive impact assessment.
-
 CHANGE REQUEST:
 Title: {change.title}
 Type: {change.change_type}
@@ -196,33 +260,10 @@ Description: {change.description}
 Affected Systems: {', '.join(change.affected_systems)}
 Technical Details: {change.technical_details}
 Business Justification: {change.business_justification}
-
-Provide a detailed impact assessment covering:
-1. Risk Level (critical/high/medium/low/minimal)
-2. Affected Components (list all impacted components)
-3. Affected Users (estimate of user impact)
-4. Performance Impact (expected performance changes)
-5. Compliance Impact (EU AI Act Article 17, 43 implications)
-6. Rollback Complexity (easy/moderate/complex/very complex)
-7. Testing Requirements (specific tests needed)
-8. Dependencies (other systems/changes this depends on)
-9. Recommendations and Risk Mitigation
-
-Format as JSON with these exact keys:
-- risk_level
-- affected_components (array)
-- affected_users
-- performance_impact
-- compliance_impact
-- rollback_complexity
-- testing_requirements (array)
-- dependencies (array)
-- analysis (detailed text)
-- confidence_score (0.0-1.0)
 """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = self._get_assessment_model().generate_content(prompt)
             result_text = response.text.strip()
             
             if result_text.startswith("```json"):
@@ -259,6 +300,21 @@ Format as JSON with these exact keys:
             print(f"AI assessment failed: {e}, using manual assessment")
             return self._manual_impact_assessment(change)
     
+    def _get_assessment_model(self):
+        """Return the impact-assessment model, building it on first use.
+        
+        The model carries IMPACT_ASSESSMENT_INSTRUCTIONS as a static system
+        instruction (sent along with every request), so the prompts built in
+        assess_impact only need the change-specific details.
+        """
+        with self._assessment_model_lock:
+            if self._assessment_model is None:
+                self._assessment_model = genai.GenerativeModel(
+                    GEMINI_MODEL,
+                    system_instruction=IMPACT_ASSESSMENT_INSTRUCTIONS
+                )
+            return self._assessment_model
+    
     def _manual_impact_assessment(self, change: ChangeRequest) -> ImpactAssessment:
         """Fallback manual impact assessment"""
         risk_mapping = {
@@ -459,47 +515,49 @@ Format as JSON with these exact keys:
         )
         
         test_report_path = self.tests_dir / f"{test_id}_report.json"
-        with open(test_report_path, 'w') as f:
-            json.dump(asdict(result), f, indent=2)
+        _write_json(test_report_path, asdict(result))
         
         return result
     
     def request_approval(self, change_id: str, approver: str, notes: str = "") -> Dict:
         """Request approval for a change"""
         change = self._load_change(change_id)
-        
-        approval_request = {
-            "approver": approver,
-            "requested_at": datetime.now().isoformat(),
-            "status": "pending",
-            "notes": notes,
-            "approved_at": None,
-            "decision_notes": None
-        }
-        
-        change.approvals.append(approval_request)
-        change.status = ChangeStatus.PENDING_APPROVAL.value
-        change.updated_at = datetime.now().isoformat()
+        approval_request = self._add_approval_request(change, approver, notes)
         self._save_change(change)
         self._log_change_event(change_id, "approval_requested", f"Approval requested from {approver}")
         
         return approval_request
     
+    def bulk_request_approval(self, requests: List[Tuple[str, str, str]]) -> List[Dict]:
+        """Request approvals for many changes in one pass.
+        
+        Takes (change_id, approver, notes) tuples. Each change is loaded and
+        saved once and all events are appended to the log in a single write.
+        """
+        changes: Dict[str, ChangeRequest] = {}
+        events = []
+        approval_requests = []
+        
+        for change_id, approver, notes in requests:
+            if change_id not in changes:
+                changes[change_id] = self._load_change(change_id)
+            approval_requests.append(self._add_approval_request(changes[change_id], approver, notes))
+            events.append((change_id, "approval_requested", f"Approval requested from {approver}"))
+        
+        for change in changes.values():
+            self._save_change(change)
+        self._log_change_events(events)
+        
+        return approval_requests
+    
     def approve_change(self, change_id: str, approver: str, decision_notes: str = "") -> bool:
         """Approve a change request"""
         change = self._load_change(change_id)
         
-        for approval in change.approvals:
-            if approval["approver"] == approver and approval["status"] == "pending":
-                approval["status"] = "approved"
-                approval["approved_at"] = datetime.now().isoformat()
-                approval["decision_notes"] = decision_notes
-                
-                change.status = ChangeStatus.APPROVED.value
-                change.updated_at = datetime.now().isoformat()
-                self._save_change(change)
-                self._log_change_event(change_id, "approved", f"Approved by {approver}")
-                return True
+        if self._apply_decision(change, approver, "approve", decision_notes):
+            self._save_change(change)
+            self._log_change_event(change_id, "approved", f"Approved by {approver}")
+            return True
         
         return False
     
@@ -507,16 +565,76 @@ Format as JSON with these exact keys:
         """Reject a change request"""
         change = self._load_change(change_id)
         
+        if self._apply_decision(change, approver, "reject", reason):
+            self._save_change(change)
+            self._log_change_event(change_id, "rejected", f"Rejected by {approver}: {reason}")
+            return True
+        
+        return False
+    
+    def bulk_decide(self, decisions: List[Tuple[str, str, str, str]]) -> List[bool]:
+        """Approve or reject many changes in one pass.
+        
+        Takes (change_id, approver, decision, notes) tuples where decision is
+        "approve" or "reject". Returns one flag per decision, False when the
+        approver had no pending approval on that change.
+        """
+        changes: Dict[str, ChangeRequest] = {}
+        dirty = set()
+        events = []
+        results = []
+        
+        for change_id, approver, decision, notes in decisions:
+            if decision not in ("approve", "reject"):
+                raise ValueError(f"Unknown decision: {decision}")
+            if change_id not in changes:
+                changes[change_id] = self._load_change(change_id)
+            
+            applied = self._apply_decision(changes[change_id], approver, decision, notes)
+            if applied:
+                dirty.add(change_id)
+                if decision == "approve":
+                    events.append((change_id, "approved", f"Approved by {approver}"))
+                else:
+                    events.append((change_id, "rejected", f"Rejected by {approver}: {notes}"))
+            results.append(applied)
+        
+        for change_id in dirty:
+            self._save_change(changes[change_id])
+        self._log_change_events(events)
+        
+        return results
+    
+    def _add_approval_request(self, change: ChangeRequest, approver: str, notes: str) -> Dict:
+        """Append a pending approval to an in-memory change record"""
+        approval_request = {
+            "approver": approver,
+            "requested_at": datetime.now().isoformat(),
+            "status": "pending",
+            "notes": notes,
+            "approved_at": None,
+            "decision_notes": None
+        }
+        
+        change.approvals.append(approval_request)
+        change.status = ChangeStatus.PENDING_APPROVAL.value
+        change.updated_at = datetime.now().isoformat()
+        
+        return approval_request
+    
+    def _apply_decision(self, change: ChangeRequest, approver: str, decision: str, notes: str) -> bool:
+        """Record an approve/reject decision on an in-memory change record"""
         for approval in change.approvals:
             if approval["approver"] == approver and approval["status"] == "pending":
-                approval["status"] = "rejected"
+                approval["status"] = "approved" if decision == "approve" else "rejected"
                 approval["approved_at"] = datetime.now().isoformat()
-                approval["decision_notes"] = reason
+                approval["decision_notes"] = notes
                 
-                change.status = ChangeStatus.REJECTED.value
+                if decision == "approve":
+                    change.status = ChangeStatus.APPROVED.value
+                else:
+                    change.status = ChangeStatus.REJECTED.value
                 change.updated_at = datetime.now().isoformat()
-                self._save_change(change)
-                self._log_change_event(change_id, "rejected", f"Rejected by {approver}: {reason}")
                 return True
         
         return False
@@ -565,6 +683,22 @@ Format as JSON with these exact keys:
             change.updated_at = datetime.now().isoformat()
             self._save_change(change)
     
+    def deploy_batch(self, change_ids: List[str], deployed_by: str, notes: str = "") -> List[Dict]:
+        """Deploy and complete several approved changes in one pass.
+        
+        Runs deploy_change and a successful complete_deployment for each
+        change inside batch_writes(), so every change file is written once
+        and the log is appended once for the whole batch.
+        """
+        deployment_records = []
+        
+        with self.batch_writes():
+            for change_id in change_ids:
+                deployment_records.append(self.deploy_change(change_id, deployed_by))
+                self.complete_deployment(change_id, success=True, notes=notes)
+        
+        return deployment_records
+    
     def rollback_change(self, change_id: str, rolled_back_by: str, reason: str) -> Dict:
         """Execute rollback of a deployed change"""
         change = self._load_change(change_id)
@@ -627,19 +761,18 @@ Format as JSON with these exact keys:
         changes = []
         
         for change_file in self.changes_dir.glob("*.json"):
-            with open(change_file, 'r') as f:
-                change_data = json.load(f)
-                
-                if status_filter is None or change_data["status"] == status_filter:
-                    changes.append({
-                        "change_id": change_data["change_id"],
-                        "title": change_data["title"],
-                        "status": change_data["status"],
-                        "priority": change_data["priority"],
-                        "change_type": change_data["change_type"],
-                        "created_at": change_data["created_at"],
-                        "requester": change_data["requester"]
-                    })
+            change_data = _read_json(change_file)
+            
+            if status_filter is None or change_data["status"] == status_filter:
+                changes.append({
+                    "change_id": change_data["change_id"],
+                    "title": change_data["title"],
+                    "status": change_data["status"],
+                    "priority": change_data["priority"],
+                    "change_type": change_data["change_type"],
+                    "created_at": change_data["created_at"],
+                    "requester": change_data["requester"]
+                })
         
         changes.sort(key=lambda x: x["created_at"], reverse=True)
         return changes
@@ -650,36 +783,84 @@ Format as JSON with these exact keys:
         hash_suffix = hashlib.md5(title.encode()).hexdigest()[:6]
         return f"CHG-{timestamp}-{hash_suffix}"
     
+    @contextmanager
+    def batch_writes(self):
+        """Defer change-record and event-log writes until the block exits.
+        
+        Inside the block each change is written at most once and all log
+        events are appended in one write when the block ends. Reads through
+        _load_change see the buffered records; list_changes reads disk only.
+        Not meant to be shared between threads.
+        """
+        if self._pending_changes is not None:
+            yield
+            return
+        
+        self._pending_changes = {}
+        self._pending_log_lines = []
+        try:
+            yield
+        finally:
+            pending_changes, pending_lines = self._pending_changes, self._pending_log_lines
+            self._pending_changes = None
+            self._pending_log_lines = None
+            
+            for change in pending_changes.values():
+                self._save_change(change)
+            self._append_log_lines(pending_lines)
+    
     def _save_change(self, change: ChangeRequest) -> None:
         """Save change request to disk"""
+        if self._pending_changes is not None:
+            self._pending_changes[change.change_id] = change
+            return
+        
         change_file = self.changes_dir / f"{change.change_id}.json"
-        with open(change_file, 'w') as f:
-            json.dump(asdict(change), f, indent=2)
+        _write_json(change_file, asdict(change))
     
     def _load_change(self, change_id: str) -> ChangeRequest:
         """Load change request from disk"""
+        if self._pending_changes is not None and change_id in self._pending_changes:
+            return self._pending_changes[change_id]
+        
         change_file = self.changes_dir / f"{change_id}.json"
         
         if not change_file.exists():
             raise FileNotFoundError(f"Change request {change_id} not found")
         
-        with open(change_file, 'r') as f:
-            data = json.load(f)
-            return ChangeRequest(**data)
+        return ChangeRequest(**_read_json(change_file))
     
     def _log_change_event(self, change_id: str, event_type: str, description: str) -> None:
         """Log change management events"""
-        log_file = self.storage_dir / "change_events.log"
+        self._log_change_events([(change_id, event_type, description)])
+    
+    def _log_change_events(self, events: List[Tuple[str, str, str]]) -> None:
+        """Append (change_id, event_type, description) events to the log in one write"""
+        timestamp = datetime.now().isoformat()
         
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "change_id": change_id,
-            "event_type": event_type,
-            "description": description
-        }
+        lines = [
+            json.dumps({
+                "timestamp": timestamp,
+                "change_id": change_id,
+                "event_type": event_type,
+                "description": description
+            }) + "\n"
+            for change_id, event_type, description in events
+        ]
         
+        if self._pending_log_lines is not None:
+            self._pending_log_lines.extend(lines)
+        else:
+            self._append_log_lines(lines)
+    
+    def _append_log_lines(self, lines: List[str]) -> None:
+        """Append pre-serialized event lines to the change log"""
+        if not lines:
+            return
+        
+        log_file = self.storage_dir / "change_events.log"
         with open(log_file, 'a') as f:
-            f.write(json.dumps(event) + "\n")
+            f.write("".join(lines))
 
 
 def main():
@@ -719,7 +900,7 @@ def main():
     
     print("Running automated tests...")
     tests = cms.run_automated_tests(change.change_id, test_suite="comprehensive")
-    print(f"✓ Tests Complete: {sum(1 for t in tests if t.passed)}/{len(tests)} passed\n")
+    print(f"✓ Tests Complete: {sum(t.passed for t in tests)}/{len(tests)} passed\n")
     
     print("Requesting approval...")
     cms.request_approval(change.change_id, "compliance-officer@company.com", "Article 17 compliance review")
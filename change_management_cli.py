@@ -325,7 +325,7 @@ class ChangeManagementCLI:
                 
                 console.print(table)
                 
-                passed = sum(1 for r in results if r.passed)
+                passed = sum(r.passed for r in results)
                 total = len(results)
                 
                 if passed == total:
@@ -3,15 +3,27 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
+import io
 import json
+import mmap
 import os
 import re
 import shutil
 import subprocess
-from dataclasses import dataclass, asdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 _REPO_ROOT = Path(__file__).resolve().parent
@@ -27,8 +39,17 @@ _DEFAULT_EXCLUDES = {
     "Risks packages",
 }
 
+_CODE_SUFFIXES = frozenset({".py", ".js", ".ts", ".tsx", ".sh", ".yaml", ".yml"})
+_BINARY_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".pdf", ".mov", ".xlsx"})
+
+# Below this many files the process pool costs more than it saves.
+_PARALLEL_MIN_FILES = 200
+
+# A NUL byte this close to the start marks a file as binary.
+_BINARY_SNIFF_BYTES = 512
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ToolResult:
     name: str
     status: str
@@ -36,8 +57,17 @@ class ToolResult:
     stdout: str = ""
     stderr: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "details": self.details,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Finding:
     category: str
     severity: str
@@ -45,8 +75,17 @@ class Finding:
     evidence: str
     recommendation: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "category": self.category,
+            "severity": self.severity,
+            "title": self.title,
+            "evidence": self.evidence,
+            "recommendation": self.recommendation,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class CybersecurityAssessmentReport:
     generated_at: str
     scope_root: str
@@ -55,100 +94,312 @@ class CybersecurityAssessmentReport:
     findings: List[Dict[str, Any]]
     summary: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "scope_root": self.scope_root,
+            "eu_ai_act_alignment": self.eu_ai_act_alignment,
+            "tool_results": self.tool_results,
+            "findings": self.findings,
+            "summary": self.summary,
+        }
+
+
+_SECRET_PATTERNS: List[Tuple[str, re.Pattern[bytes]]] = [
+    ("Private key", re.compile(rb"-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----")),
+    ("AWS access key", re.compile(rb"\bAKIA[0-9A-Z]{16}\b")),
+    ("Slack token", re.compile(rb"\bxox[baprs]-[0-9A-Za-z-]{10,}\b")),
+    ("Generic API key", re.compile(rb"(?i:\b(?:api[_-]?key|secret|token)\b\s*[:=]\s*['\"]?[0-9a-zA-Z_\-]{16,}['\"]?)")),
+]
 
-_SECRET_PATTERNS: List[Tuple[str, re.Pattern[str]]] = [
-    ("Private key", re.compile(r"-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----")),
-    ("AWS access key", re.compile(r"\bAKIA[0-9A-Z]{16}\b")),
-    ("Slack token", re.compile(r"\bxox[baprs]-[0-9A-Za-z-]{10,}\b")),
-    ("Generic API key", re.compile(r"(?i)\b(api[_-]?key|secret|token)\b\s*[:=]\s*['\"]?[0-9a-zA-Z_\-]{16,}['\"]?")),
+_CODE_CHECKS: List[Tuple[str, str, str, re.Pattern[bytes], str]] = [
+    (
+        "security_code_review",
+        "medium",
+        "Use of eval/exec",
+        re.compile(rb"\b(?:eval|exec)\s*\("),
+        "Avoid dynamic code execution. If unavoidable, strictly constrain inputs and use safe parsers.",
+    ),
+    (
+        "security_code_review",
+        "medium",
+        "subprocess with shell=True",
+        re.compile(rb"subprocess\.(?:Popen|run|call|check_call|check_output)\([^\n]*shell\s*=\s*True"),
+        "Avoid shell=True. Prefer argv lists and validate inputs. If required, hardcode commands and escape arguments.",
+    ),
+    (
+        "security_code_review",
+        "low",
+        "Potential insecure YAML load",
+        re.compile(rb"yaml\.load\("),
+        "Use yaml.safe_load for untrusted YAML.",
+    ),
 ]
 
 
-def _iter_text_files(root: Path, excludes: set[str]) -> List[Path]:
-    paths: List[Path] = []
-    for p in root.rglob("*"):
-        rel_parts = set(p.relative_to(root).parts)
-        if rel_parts & excludes:
-            continue
-        if not p.is_file():
-            continue
-        if p.suffix.lower() in {".png", ".jpg", ".jpeg", ".gif", ".pdf", ".mov", ".xlsx"}:
-            continue
-        if p.stat().st_size > 2_000_000:
-            continue
-        paths.append(p)
-    return paths
+def _combine_patterns(patterns: List[re.Pattern[bytes]]) -> re.Pattern[bytes]:
+    # Each alternative sits in a zero-width lookahead so one finditer pass
+    # reports every pattern, even where matches of different patterns overlap.
+    return re.compile(b"|".join(b"(?=(?P<g%d>%s))" % (i, p.pattern) for i, p in enumerate(patterns)))
+
 
+def _compile_hyperscan(patterns: List[re.Pattern[bytes]]) -> Any:
+    try:
+        import hyperscan
+    except Exception:
+        return None
 
-def _scan_secrets(root: Path, excludes: set[str]) -> List[Finding]:
-    findings: List[Finding] = []
-    for path in _iter_text_files(root, excludes):
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+        return db
+    except Exception:
+        return None
+
+
+class _PatternSet:
+    """Reports which of several patterns occur in a bytes-like buffer.
+
+    Uses a Hyperscan database when python-hyperscan is installed and falls
+    back to a single combined ``re`` pattern otherwise.
+    """
+
+    def __init__(self, patterns: List[re.Pattern[bytes]]):
+        self._count = len(patterns)
+        self._regex = _combine_patterns(patterns)
+        self._hs_db = _compile_hyperscan(patterns)
+
+    def matched(self, content: Any) -> List[int]:
+        # One pass over the whole buffer: an mmap is paged in lazily, so large
+        # files need no windowing (which would let \b and $ match at artificial
+        # window ends). The scan stops as soon as every pattern has been seen.
+        seen: set[int] = set()
+        if self._hs_db is not None:
+
+            def on_match(idx: int, match_start: int, match_end: int, flags: int, context: Any) -> bool:
+                seen.add(idx)
+                return len(seen) == self._count
+
+            try:
+                with memoryview(content) as view:
+                    self._hs_db.scan(view, match_event_handler=on_match)
+                return sorted(seen)
+            except Exception:
+                # Terminating from the callback surfaces as an exception.
+                if len(seen) == self._count:
+                    return sorted(seen)
+                seen.clear()
+
+        for m in self._regex.finditer(content):
+            seen.add(int(m.lastgroup[1:]))
+            if len(seen) == self._count:
+                break
+        return sorted(seen)
+
+
+_SECRET_MATCHER = _PatternSet([p for _, p in _SECRET_PATTERNS])
+_CODE_MATCHER = _PatternSet([c[3] for c in _CODE_CHECKS])
+
+# Cached scan results are discarded whenever the pattern set changes.
+_CACHE_SIGNATURE = hashlib.sha256(
+    b"\0".join([p.pattern for _, p in _SECRET_PATTERNS] + [c[3].pattern for c in _CODE_CHECKS])
+).hexdigest()
+
+
+# (secret pattern indices, code check indices, sha256 of the file or None),
+# or None when the file could not be read
+_ScanResult = Optional[Tuple[List[int], List[int], Optional[str]]]
+
+
+def _scan_file(path: Path, with_digest: bool = False) -> _ScanResult:
+    # Map each file once and run both matchers over the same raw bytes.
+    scan_code = path.suffix.lower() in _CODE_SUFFIXES
+    try:
+        with path.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return [], [], None
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.sha256(mm).hexdigest() if with_digest else None
+                if mm.find(b"\x00", 0, _BINARY_SNIFF_BYTES) != -1:
+                    return [], [], digest
+                return _SECRET_MATCHER.matched(mm), (_CODE_MATCHER.matched(mm) if scan_code else []), digest
+    except Exception:
+        return None
+
+
+def _scan_chunk(paths: List[Path], with_digest: bool = False) -> List[_ScanResult]:
+    # Workers use their own module-level matchers rather than pickled
+    # compiled patterns or Hyperscan databases.
+    return [_scan_file(p, with_digest) for p in paths]
+
+
+def _scan_paths(paths: List[Path], workers: int, with_digest: bool = False) -> List[_ScanResult]:
+    if workers <= 1 or len(paths) < _PARALLEL_MIN_FILES:
+        return _scan_chunk(paths, with_digest)
+
+    # Deferred: pulling in multiprocessing is only worth it for big scopes.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # run_assessment scans while its tool/threat-model threads are live, and
+    # forking a multi-threaded process can deadlock the child, so start workers
+    # from a clean forkserver where the platform has one.
+    mp_context = (
+        multiprocessing.get_context("forkserver")
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else None
+    )
+
+    size = -(-len(paths) // workers)
+    chunks = [paths[i : i + size] for i in range(0, len(paths), size)]
+    results: List[_ScanResult] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+        for chunk_result in ex.map(_scan_chunk, chunks, [with_digest] * len(chunks)):
+            results.extend(chunk_result)
+    return results
+
+
+def _iter_text_files(root: Path, excludes: set[str]) -> List[Tuple[Path, os.stat_result]]:
+    # Excluded names are pruned before descending, so trees like .git or
+    # .venv are never listed at all.
+    files: List[Tuple[Path, os.stat_result]] = []
+    stack = [str(root)]
+    while stack:
         try:
-            content = path.read_text(errors="ignore")
-        except Exception:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
             continue
 
-        for label, pat in _SECRET_PATTERNS:
-            if pat.search(content):
-                findings.append(
-                    Finding(
-                        category="secrets_management",
-                        severity="high",
-                        title=f"Potential secret detected: {label}",
-                        evidence=str(path.relative_to(root)),
-                        recommendation="Rotate impacted credentials, remove secrets from repo history, and enforce secret scanning in CI.",
-                    )
-                )
-    return findings
-
-
-def _scan_code_patterns(root: Path, excludes: set[str]) -> List[Finding]:
-    checks: List[Tuple[str, str, str, re.Pattern[str], str]] = [
-        (
-            "security_code_review",
-            "medium",
-            "Use of eval/exec",
-            re.compile(r"\b(eval|exec)\s*\("),
-            "Avoid dynamic code execution. If unavoidable, strictly constrain inputs and use safe parsers.",
-        ),
-        (
-            "security_code_review",
-            "medium",
-            "subprocess with shell=True",
-            re.compile(r"subprocess\.(?:Popen|run|call|check_call|check_output)\([^\n]*shell\s*=\s*True"),
-            "Avoid shell=True. Prefer argv lists and validate inputs. If required, hardcode commands and escape arguments.",
-        ),
-        (
-            "security_code_review",
-            "low",
-            "Potential insecure YAML load",
-            re.compile(r"yaml\.load\("),
-            "Use yaml.safe_load for untrusted YAML.",
-        ),
-    ]
+        for entry in entries:
+            if entry.name in excludes:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in _BINARY_SUFFIXES:
+                    continue
+                files.append((Path(entry.path), entry.stat()))
+            except OSError:
+                continue
+    return files
+
+
+def _load_scan_cache(cache_path: Path, scope_root: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(cache_path.read_text())
+    except Exception:
+        return {}
+    if data.get("signature") != _CACHE_SIGNATURE or data.get("scope_root") != str(scope_root):
+        return {}
+    return data.get("files", {})
+
+
+def _save_scan_cache(cache_path: Path, scope_root: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"signature": _CACHE_SIGNATURE, "scope_root": str(scope_root), "files": entries})
+        )
+    except Exception:
+        pass
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    try:
+        with path.open("rb") as fh:
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+    except Exception:
+        return None
 
-    findings: List[Finding] = []
-    for path in _iter_text_files(root, excludes):
-        if path.suffix.lower() not in {".py", ".js", ".ts", ".tsx", ".sh", ".yaml", ".yml"}:
+
+def _scan_with_cache(
+    scope_root: Path,
+    files: List[Tuple[Path, os.stat_result]],
+    workers: int,
+    cache_path: Optional[Path],
+) -> List[Tuple[List[int], List[int]]]:
+    """Scan ``files``, reusing cached results for files that have not changed.
+
+    A file is reused when its size and mtime match the cache entry, or when
+    only the mtime moved but its SHA-256 is unchanged. With no ``cache_path``
+    every file is scanned.
+    """
+    if cache_path is None:
+        return [(r[0], r[1]) if r is not None else ([], []) for r in _scan_paths([p for p, _ in files], workers)]
+
+    cached = _load_scan_cache(cache_path, scope_root)
+    entries: Dict[str, Dict[str, Any]] = {}
+    results: List[Tuple[List[int], List[int]]] = [([], [])] * len(files)
+    pending: List[int] = []
+
+    for i, (path, st) in enumerate(files):
+        rel = str(path.relative_to(scope_root))
+        entry = cached.get(rel)
+        if entry is not None and entry.get("size") == st.st_size:
+            if entry.get("mtime_ns") != st.st_mtime_ns:
+                digest = entry.get("sha256")
+                if digest is None or _file_sha256(path) != digest:
+                    pending.append(i)
+                    continue
+                entry = {**entry, "mtime_ns": st.st_mtime_ns}
+            entries[rel] = entry
+            results[i] = (entry["secrets"], entry["code"])
             continue
-        try:
-            content = path.read_text(errors="ignore")
-        except Exception:
+        pending.append(i)
+
+    scanned = _scan_paths([files[i][0] for i in pending], workers, with_digest=True)
+    for i, result in zip(pending, scanned):
+        if result is None:
+            # Unreadable this time: report nothing, and leave it uncached so the next run retries
             continue
+        secret_ids, code_ids, digest = result
+        path, st = files[i]
+        entries[str(path.relative_to(scope_root))] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "secrets": secret_ids,
+            "code": code_ids,
+        }
+        results[i] = (secret_ids, code_ids)
+
+    _save_scan_cache(cache_path, scope_root, entries)
+    return results
+
+
+def _scan_secrets(root: Path, scanned: Iterable[Tuple[Path, List[int]]]) -> Iterator[Finding]:
+    for path, matched in scanned:
+        for idx in matched:
+            label = _SECRET_PATTERNS[idx][0]
+            yield Finding(
+                category="secrets_management",
+                severity="high",
+                title=f"Potential secret detected: {label}",
+                evidence=str(path.relative_to(root)),
+                recommendation="Rotate impacted credentials, remove secrets from repo history, and enforce secret scanning in CI.",
+            )
 
-        for category, severity, title, pat, rec in checks:
-            if pat.search(content):
-                findings.append(
-                    Finding(
-                        category=category,
-                        severity=severity,
-                        title=title,
-                        evidence=str(path.relative_to(root)),
-                        recommendation=rec,
-                    )
-                )
 
-    return findings
+def _scan_code_patterns(root: Path, scanned: Iterable[Tuple[Path, List[int]]]) -> Iterator[Finding]:
+    for path, matched in scanned:
+        for idx in matched:
+            category, severity, title, _, rec = _CODE_CHECKS[idx]
+            yield Finding(
+                category=category,
+                severity=severity,
+                title=title,
+                evidence=str(path.relative_to(root)),
+                recommendation=rec,
+            )
 
 
 def _run_optional_tool(name: str, args: List[str], cwd: Path) -> ToolResult:
@@ -205,33 +456,51 @@ def _threat_model_with_llm(system_description: str) -> Optional[str]:
 def _summarize(findings: List[Finding], tool_results: List[ToolResult]) -> Dict[str, Any]:
     sev_order = {"critical": 4, "high": 3, "medium": 2, "low": 1}
     counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    for f in findings:
-        counts[f.severity] = counts.get(f.severity, 0) + 1
+    counts.update(Counter(f.severity for f in findings))
 
-    top = sorted(findings, key=lambda f: sev_order.get(f.severity, 0), reverse=True)[:10]
+    top = heapq.nlargest(10, findings, key=lambda f: sev_order.get(f.severity, 0))
     tools_failed = [t.name for t in tool_results if t.status == "failed"]
 
     return {
         "finding_counts": counts,
-        "top_findings": [asdict(f) for f in top],
+        "top_findings": [f.to_dict() for f in top],
         "tools_failed": tools_failed,
     }
 
 
-def run_assessment(scope_root: Path, system_description: str, excludes: Optional[List[str]] = None) -> CybersecurityAssessmentReport:
+def run_assessment(
+    scope_root: Path,
+    system_description: str,
+    excludes: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    cache_path: Optional[Path] = None,
+) -> CybersecurityAssessmentReport:
     exclude_set = set(excludes or []) | _DEFAULT_EXCLUDES
+    workers = workers or os.cpu_count() or 1
 
-    findings: List[Finding] = []
-    findings.extend(_scan_secrets(scope_root, exclude_set))
-    findings.extend(_scan_code_patterns(scope_root, exclude_set))
-
-    tool_results = [
-        _run_optional_tool("Bandit (Python SAST)", ["bandit", "-q", "-r", str(scope_root)], cwd=scope_root),
-        _run_optional_tool("pip-audit (deps)", ["pip-audit"], cwd=scope_root),
-        _run_optional_tool("gitleaks (secrets)", ["gitleaks", "detect", "--no-git"], cwd=scope_root),
+    tools = [
+        ("Bandit (Python SAST)", ["bandit", "-q", "-r", str(scope_root)]),
+        ("pip-audit (deps)", ["pip-audit"]),
+        ("gitleaks (secrets)", ["gitleaks", "detect", "--no-git"]),
     ]
+    # The external tools are independent subprocesses and the threat model is
+    # a network round-trip, so all of them run side by side (and alongside the
+    # file scan) instead of one after another.
+    with ThreadPoolExecutor(max_workers=len(tools) + 1) as tool_pool:
+        tool_futures = [tool_pool.submit(_run_optional_tool, name, args, scope_root) for name, args in tools]
+        threat_model_future = tool_pool.submit(_threat_model_with_llm, system_description)
+
+        files = _iter_text_files(scope_root, exclude_set)
+        paths = [p for p, _ in files]
+        scanned = _scan_with_cache(scope_root, files, workers, cache_path)
+
+        findings: List[Finding] = []
+        findings.extend(_scan_secrets(scope_root, ((p, r[0]) for p, r in zip(paths, scanned))))
+        findings.extend(_scan_code_patterns(scope_root, ((p, r[1]) for p, r in zip(paths, scanned))))
+
+        tool_results = [f.result() for f in tool_futures]
+        threat_model = threat_model_future.result()
 
-    threat_model = _threat_model_with_llm(system_description)
     if threat_model:
         findings.append(
             Finding(
@@ -270,49 +539,62 @@ def run_assessment(scope_root: Path, system_description: str, excludes: Optional
         generated_at=datetime.now().isoformat(),
         scope_root=str(scope_root),
         eu_ai_act_alignment=eu_ai_act_alignment,
-        tool_results=[asdict(t) for t in tool_results],
-        findings=[asdict(f) for f in findings],
+        tool_results=[t.to_dict() for t in tool_results],
+        findings=[f.to_dict() for f in findings],
         summary=summary,
     )
 
 
 def _to_markdown(report: CybersecurityAssessmentReport) -> str:
-    lines: List[str] = []
-    lines.append(f"# Cybersecurity Assessment Report")
-    lines.append("")
-    lines.append(f"Generated at: `{report.generated_at}`")
-    lines.append(f"Scope: `{report.scope_root}`")
-    lines.append("")
-
-    lines.append("## EU AI Act Alignment")
-    lines.append("")
-    lines.append("- Article 15(1): system security, data protection, attack prevention")
-    lines.append("- Article 15(4): resilience against attacks / integrity controls")
-    lines.append("")
-
-    lines.append("## Automated Tool Results")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Cybersecurity Assessment Report\n\n")
+    w(f"Generated at: `{report.generated_at}`\n")
+    w(f"Scope: `{report.scope_root}`\n\n")
+
+    w("## EU AI Act Alignment\n\n")
+    w("- Article 15(1): system security, data protection, attack prevention\n")
+    w("- Article 15(4): resilience against attacks / integrity controls\n\n")
+
+    w("## Automated Tool Results\n\n")
     for t in report.tool_results:
-        lines.append(f"- **{t['name']}**: `{t['status']}` ({t['details']})")
-    lines.append("")
+        w(f"- **{t['name']}**: `{t['status']}` ({t['details']})\n")
+    w("\n")
 
-    lines.append("## Findings")
-    lines.append("")
+    w("## Findings\n\n")
     for f in report.findings:
-        lines.append(f"### {f['severity'].upper()}: {f['title']}")
-        lines.append("")
-        lines.append(f"- Category: `{f['category']}`")
-        lines.append(f"- Evidence: {f['evidence'] if f['category'] == 'threat_modeling' else '`' + f['evidence'] + '`'}")
-        lines.append(f"- Recommendation: {f['recommendation']}")
-        lines.append("")
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("```json")
-    lines.append(json.dumps(report.summary, indent=2))
-    lines.append("```")
-    lines.append("")
-    return "\n".join(lines)
+        w(f"### {f['severity'].upper()}: {f['title']}\n\n")
+        w(f"- Category: `{f['category']}`\n")
+        w(f"- Evidence: {f['evidence'] if f['category'] == 'threat_modeling' else '`' + f['evidence'] + '`'}\n")
+        w(f"- Recommendation: {f['recommendation']}\n\n")
+
+    w("## Summary\n\n")
+    w("```json\n")
+    json.dump(report.summary, buf, indent=2)
+    w("\n```\n")
+    return buf.getvalue()
+
+
+def _write_json_stream(report: CybersecurityAssessmentReport, fp: BinaryIO) -> None:
+    """Write ``report`` as indented JSON, encoding top-level lists item by item.
+
+    Produces the same layout as ``json.dump(..., indent=2)`` without building
+    one bytes object for the whole report. Requires orjson.
+    """
+    opt = orjson.OPT_INDENT_2
+    fp.write(b"{")
+    for i, (key, value) in enumerate(report.to_dict().items()):
+        fp.write(b",\n  " if i else b"\n  ")
+        fp.write(orjson.dumps(key) + b": ")
+        if isinstance(value, list) and value:
+            fp.write(b"[")
+            for j, item in enumerate(value):
+                fp.write(b",\n    " if j else b"\n    ")
+                fp.write(orjson.dumps(item, option=opt).replace(b"\n", b"\n    "))
+            fp.write(b"\n  ]")
+        else:
+            fp.write(orjson.dumps(value, option=opt).replace(b"\n", b"\n  "))
+    fp.write(b"\n}")
 
 
 def main() -> None:
@@ -325,10 +607,23 @@ def main() -> None:
         default="Python-based EU AI Act compliance tooling including metrics, incident management, and webhooks.",
     )
     parser.add_argument("--exclude", action="append", default=[], help="Additional directory/file names to exclude")
+    parser.add_argument("--workers", type=int, default=None, help="Processes used for file scanning (default: CPU count)")
+    parser.add_argument(
+        "--cache",
+        default=str(_REPO_ROOT / "Output" / ".cyberassess_cache.json"),
+        help="Scan cache used to skip unchanged files on re-runs",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file and leave the cache untouched")
     args = parser.parse_args()
 
     scope = Path(args.scope).resolve()
-    report = run_assessment(scope, args.system_description, excludes=args.exclude)
+    report = run_assessment(
+        scope,
+        args.system_description,
+        excludes=args.exclude,
+        workers=args.workers,
+        cache_path=None if args.no_cache else Path(args.cache),
+    )
 
     out_md = Path(args.output)
     out_md.parent.mkdir(parents=True, exist_ok=True)
@@ -336,7 +631,12 @@ def main() -> None:
 
     out_json = Path(args.json_output)
     out_json.parent.mkdir(parents=True, exist_ok=True)
-    out_json.write_text(json.dumps(asdict(report), indent=2))
+    if ORJSON_AVAILABLE:
+        with out_json.open("wb") as fp:
+            _write_json_stream(report, fp)
+    else:
+        with out_json.open("w") as fp:
+            json.dump(report.to_dict(), fp, indent=2)
 
     print(str(out_md))
 
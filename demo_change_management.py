@@ -3,9 +3,12 @@ Comprehensive Demo/Test for Change Management System
 Demonstrates all features: workflow, AI assessment, testing, approvals, deployment, rollback
 """
 
-import os
-import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import Dict, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -20,14 +23,117 @@ from change_management import (
     ChangePriority,
     ChangeStatus
 )
+from demo_pacing import DemoPacer
 
 console = Console()
 
+# Display labels for the fixed status and type enums, e.g. "pending_approval" -> "Pending Approval"
+STATUS_DISPLAY = {s.value: s.value.replace("_", " ").title() for s in ChangeStatus}
+TYPE_DISPLAY = {t.value: t.value.replace("_", " ").title() for t in ChangeType}
+
+# Rich styles for the enum values shown in the demo tables
+PRIORITY_COLORS = {
+    "critical": "bold red",
+    "high": "red",
+    "medium": "yellow",
+    "low": "green"
+}
+
+RISK_COLORS = {
+    "critical": "bold red",
+    "high": "red",
+    "medium": "yellow",
+    "low": "green",
+    "minimal": "dim green"
+}
+
+APPROVAL_COLORS = {
+    "pending": "yellow",
+    "approved": "green",
+    "rejected": "red"
+}
+
+STATUS_COLORS = {
+    "draft": "dim",
+    "pending_approval": "yellow",
+    "approved": "green",
+    "deployed": "bold green",
+    "rejected": "red",
+    "rolled_back": "red"
+}
+
+
+def _truncate(text: str, width: int) -> str:
+    return text[:width] + "..." if len(text) > width else text
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSummary:
+    """Display strings for a change, computed once when the change is created"""
+    change_id: str
+    short_id: str
+    title_display: str
+    title_short: str
+    priority: str
+    
+    @classmethod
+    def from_change(cls, change) -> "ChangeSummary":
+        return cls(
+            change_id=change.change_id,
+            short_id=change.change_id[-12:],
+            title_display=_truncate(change.title, 50),
+            title_short=_truncate(change.title, 30),
+            priority=change.priority
+        )
+
 
 class ChangeManagementDemo:
     def __init__(self):
         self.cms = ChangeManagementSystem()
         self.demo_changes = []
+        self.summaries: Dict[str, ChangeSummary] = {}
+        self.pacer = DemoPacer(console)
+        # Deserialized change records, dropped whenever the demo mutates a change
+        self._change_cache = {}
+        # One live progress display shared by every phase; phases add and remove their own tasks
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            console=console
+        )
+    
+    def _get(self, change_id: str):
+        """Load a change record, reusing the cached copy when it is still current"""
+        if change_id not in self._change_cache:
+            self._change_cache[change_id] = self.cms._load_change(change_id)
+        return self._change_cache[change_id]
+    
+    def _invalidate(self, *change_ids: str):
+        """Drop cached change records after a mutating call"""
+        for change_id in change_ids:
+            self._change_cache.pop(change_id, None)
+    
+    @contextmanager
+    def _progress_task(self, description: str, total: Optional[float] = None):
+        """Show a task on the shared progress display for the duration of a block"""
+        task = self.progress.add_task(description, total=total)
+        try:
+            yield task
+        finally:
+            self.progress.remove_task(task)
+    
+    def _phase_header(self, number: int, title: str, subtitle: str, style: str):
+        """Print the banner that opens each demo phase"""
+        console.print(Panel(
+            f"[bold]Demo {number}: {title}[/bold]\n{subtitle}",
+            style=style,
+            border_style=style
+        ))
+    
+    def _pause(self, seconds: float):
+        """Sleep for visual pacing, scaled by DEMO_PACE"""
+        self.pacer.pause(seconds)
     
     def run_full_demo(self):
         """Run complete demonstration of all features"""
@@ -39,52 +145,48 @@ class ChangeManagementDemo:
         
         console.print("\n[bold yellow]═══ DEMO SEQUENCE ═══[/bold yellow]\n")
         
-        # Demo 1: Create multiple change requests
-        self.demo_create_changes()
-        time.sleep(1)
+        with self.progress:
+            # Demo 1: Create multiple change requests
+            self.demo_create_changes()
+            self._pause(1)
         
-        # Demo 2: AI Impact Assessment
-        self.demo_impact_assessment()
-        time.sleep(1)
+            # Demo 2: AI Impact Assessment
+            self.demo_impact_assessment()
+            self._pause(1)
         
-        # Demo 3: Rollback Plan Generation
-        self.demo_rollback_plans()
-        time.sleep(1)
+            # Demo 3: Rollback Plan Generation
+            self.demo_rollback_plans()
+            self._pause(1)
         
-        # Demo 4: Automated Testing
-        self.demo_automated_testing()
-        time.sleep(1)
+            # Demo 4: Automated Testing
+            self.demo_automated_testing()
+            self._pause(1)
         
-        # Demo 5: Approval Workflow
-        self.demo_approval_workflow()
-        time.sleep(1)
+            # Demo 5: Approval Workflow
+            self.demo_approval_workflow()
+            self._pause(1)
         
-        # Demo 6: Deployment
-        self.demo_deployment()
-        time.sleep(1)
+            # Demo 6: Deployment
+            self.demo_deployment()
+            self._pause(1)
         
-        # Demo 7: Rollback
-        self.demo_rollback()
-        time.sleep(1)
+            # Demo 7: Rollback
+            self.demo_rollback()
+            self._pause(1)
         
-        # Demo 8: Statistics and Reporting
-        self.demo_statistics()
-        time.sleep(1)
+            # Demo 8: Statistics and Reporting
+            self.demo_statistics()
+            self._pause(1)
         
-        # Demo 9: Change Status Tracking
-        self.demo_status_tracking()
+            # Demo 9: Change Status Tracking
+            self.demo_status_tracking()
         
         console.print("\n[bold green]✓ Demo Complete![/bold green]")
         console.print("[dim]All change management features demonstrated successfully[/dim]\n")
     
     def demo_create_changes(self):
         """Demo: Create various types of change requests"""
-        console.print(Panel(
-            "[bold]Demo 1: Creating Change Requests[/bold]\n"
-            "Testing different change types and priorities",
-            style="blue",
-            border_style="blue"
-        ))
+        self._phase_header(1, "Creating Change Requests", "Testing different change types and priorities", "blue")
         
         change_configs = [
             {
@@ -134,14 +236,8 @@ class ChangeManagementDemo:
             }
         ]
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Creating change requests...", total=len(change_configs))
-            
+        created = []
+        with self._progress_task("Creating change requests...", total=len(change_configs)) as task:
             for config in change_configs:
                 change = self.cms.create_change_request(
                     title=config["title"],
@@ -155,8 +251,10 @@ class ChangeManagementDemo:
                     target_deployment_date="2026-02-15"
                 )
                 self.demo_changes.append(change.change_id)
-                progress.advance(task)
-                time.sleep(0.3)
+                self.summaries[change.change_id] = ChangeSummary.from_change(change)
+                created.append(change)
+                self.progress.advance(task)
+                self._pause(0.3)
         
         table = Table(title="Created Change Requests", box=box.ROUNDED, border_style="green")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -164,20 +262,15 @@ class ChangeManagementDemo:
         table.add_column("Type", style="magenta")
         table.add_column("Priority", style="yellow")
         
-        for change_id in self.demo_changes:
-            status = self.cms.get_change_status(change_id)
-            priority_color = {
-                "critical": "bold red",
-                "high": "red",
-                "medium": "yellow",
-                "low": "green"
-            }.get(status["priority"], "white")
+        for change in created:
+            summary = self.summaries[change.change_id]
+            priority_color = PRIORITY_COLORS.get(summary.priority, "white")
             
             table.add_row(
-                change_id,
-                status["title"][:50] + "..." if len(status["title"]) > 50 else status["title"],
-                status["status"].replace("_", " ").title(),
-                f"[{priority_color}]{status['priority'].upper()}[/{priority_color}]"
+                summary.change_id,
+                summary.title_display,
+                STATUS_DISPLAY.get(change.status, change.status),
+                f"[{priority_color}]{summary.priority.upper()}[/{priority_color}]"
             )
         
         console.print(table)
@@ -185,26 +278,19 @@ class ChangeManagementDemo:
     
     def demo_impact_assessment(self):
         """Demo: AI-powered impact assessment"""
-        console.print(Panel(
-            "[bold]Demo 2: AI-Powered Impact Assessment[/bold]\n"
-            "Running Gemini AI analysis on change requests",
-            style="yellow",
-            border_style="yellow"
-        ))
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Running AI impact assessments...", total=len(self.demo_changes))
+        self._phase_header(2, "AI-Powered Impact Assessment", "Running Gemini AI analysis on change requests", "yellow")
+        
+        with self._progress_task("Running AI impact assessments...", total=len(self.demo_changes)) as task:
+            # Each assessment is an independent Gemini round-trip on its own
+            # change file, so issue them concurrently rather than one by one.
+            with ThreadPoolExecutor(max_workers=max(len(self.demo_changes), 1)) as executor:
+                futures = {executor.submit(self.cms.assess_impact, change_id): change_id for change_id in self.demo_changes}
+                for _ in as_completed(futures):
+                    self.progress.advance(task)
+            self._invalidate(*self.demo_changes)
             
-            assessments = []
-            for change_id in self.demo_changes:
-                assessment = self.cms.assess_impact(change_id)
-                assessments.append((change_id, assessment))
-                progress.advance(task)
-                time.sleep(0.5)
+            results = {change_id: future.result() for future, change_id in futures.items()}
+            assessments = [(change_id, results[change_id]) for change_id in self.demo_changes]
         
         table = Table(title="Impact Assessment Results", box=box.ROUNDED, border_style="yellow")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -214,16 +300,10 @@ class ChangeManagementDemo:
         table.add_column("AI Confidence", style="green")
         
         for change_id, assessment in assessments:
-            risk_color = {
-                "critical": "bold red",
-                "high": "red",
-                "medium": "yellow",
-                "low": "green",
-                "minimal": "dim green"
-            }.get(assessment.risk_level, "white")
+            risk_color = RISK_COLORS.get(assessment.risk_level, "white")
             
             table.add_row(
-                change_id[-12:],
+                self.summaries[change_id].short_id,
                 f"[{risk_color}]{assessment.risk_level.upper()}[/{risk_color}]",
                 str(len(assessment.affected_components)),
                 assessment.rollback_complexity,
@@ -242,7 +322,7 @@ class ChangeManagementDemo:
             f"[bold]Testing Requirements:[/bold]\n" +
             "\n".join(f"  • {req}" for req in sample_assessment.testing_requirements[:3]) +
             f"\n[bold]AI Confidence:[/bold] {sample_assessment.confidence_score:.1%}",
-            title=f"Assessment: {assessments[0][0][-12:]}",
+            title=f"Assessment: {self.summaries[assessments[0][0]].short_id}",
             border_style="yellow"
         )
         console.print(detail_panel)
@@ -250,26 +330,16 @@ class ChangeManagementDemo:
     
     def demo_rollback_plans(self):
         """Demo: Automated rollback plan generation"""
-        console.print(Panel(
-            "[bold]Demo 3: Automated Rollback Plan Generation[/bold]\n"
-            "Creating change-type specific rollback procedures",
-            style="magenta",
-            border_style="magenta"
-        ))
+        self._phase_header(3, "Automated Rollback Plan Generation", "Creating change-type specific rollback procedures", "magenta")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Generating rollback plans...", total=len(self.demo_changes))
-            
+        with self._progress_task("Generating rollback plans...", total=len(self.demo_changes)) as task:
             rollback_plans = []
             for change_id in self.demo_changes:
                 plan = self.cms.create_rollback_plan(change_id)
+                self._invalidate(change_id)
                 rollback_plans.append((change_id, plan))
-                progress.advance(task)
-                time.sleep(0.3)
+                self.progress.advance(task)
+                self._pause(0.3)
         
         table = Table(title="Rollback Plans", box=box.ROUNDED, border_style="magenta")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -279,7 +349,7 @@ class ChangeManagementDemo:
         
         for change_id, plan in rollback_plans:
             table.add_row(
-                change_id[-12:],
+                self.summaries[change_id].short_id,
                 str(len(plan["rollback_steps"])),
                 str(plan["estimated_duration_minutes"]),
                 "✓" if plan["automated"] else "✗"
@@ -294,7 +364,7 @@ class ChangeManagementDemo:
             f"[bold]Rollback Steps:[/bold]\n{steps_text}\n\n"
             f"[bold]Estimated Duration:[/bold] {sample_plan['estimated_duration_minutes']} minutes\n"
             f"[bold]Automated:[/bold] {'Yes' if sample_plan['automated'] else 'No'}",
-            title=f"Rollback Plan: {rollback_plans[0][0][-12:]}",
+            title=f"Rollback Plan: {self.summaries[rollback_plans[0][0]].short_id}",
             border_style="magenta"
         )
         console.print(plan_panel)
@@ -302,28 +372,37 @@ class ChangeManagementDemo:
     
     def demo_automated_testing(self):
         """Demo: Automated test suite execution"""
-        console.print(Panel(
-            "[bold]Demo 4: Automated Testing[/bold]\n"
-            "Running different test suites on change requests",
-            style="blue",
-            border_style="blue"
-        ))
+        self._phase_header(4, "Automated Testing", "Running different test suites on change requests", "blue")
         
         test_suites = ["quick", "standard", "comprehensive", "compliance"]
         
-        for i, change_id in enumerate(self.demo_changes[:4]):
-            suite = test_suites[i]
+        runs = list(zip(self.demo_changes[:4], test_suites))
+        
+        # Suites for different changes touch separate change files and test
+        # reports, so run them concurrently and render the tables afterwards.
+        tasks = {
+            change_id: self.progress.add_task(f"Running {suite} tests on {self.summaries[change_id].short_id}...", total=1)
+            for change_id, suite in runs
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(runs), 1)) as executor:
+                futures = {
+                    executor.submit(self.cms.run_automated_tests, change_id, suite): change_id
+                    for change_id, suite in runs
+                }
+                for future in as_completed(futures):
+                    self.progress.advance(tasks[futures[future]])
             
-            console.print(f"\n[cyan]Testing {change_id[-12:]} with '{suite}' suite...[/cyan]")
+            suite_results = {change_id: future.result() for future, change_id in futures.items()}
+            self._invalidate(*suite_results)
+        finally:
+            for task in tasks.values():
+                self.progress.remove_task(task)
+        
+        for change_id, suite in runs:
+            results = suite_results[change_id]
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"Running {suite} tests...", total=None)
-                results = self.cms.run_automated_tests(change_id, suite)
-                progress.update(task, completed=True)
+            console.print(f"\n[cyan]Results for {self.summaries[change_id].short_id} ('{suite}' suite):[/cyan]")
             
             table = Table(box=box.SIMPLE, show_header=True, border_style="blue")
             table.add_column("Test", style="cyan")
@@ -342,7 +421,7 @@ class ChangeManagementDemo:
             
             console.print(table)
             
-            passed = sum(1 for r in results if r.passed)
+            passed = sum(r.passed for r in results)
             total = len(results)
             if passed == total:
                 console.print(f"[green]✓ All {total} tests passed[/green]")
@@ -353,12 +432,7 @@ class ChangeManagementDemo:
     
     def demo_approval_workflow(self):
         """Demo: Multi-approver workflow"""
-        console.print(Panel(
-            "[bold]Demo 5: Approval Workflow[/bold]\n"
-            "Testing approval request, approval, and rejection flows",
-            style="green",
-            border_style="green"
-        ))
+        self._phase_header(5, "Approval Workflow", "Testing approval request, approval, and rejection flows", "green")
         
         approvers = [
             ("compliance-officer@company.com", "Article 17 compliance review"),
@@ -367,36 +441,37 @@ class ChangeManagementDemo:
             ("product-manager@company.com", "Business alignment check")
         ]
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Processing approvals...", total=len(self.demo_changes))
+        approval_requests = []
+        decisions = []
+        for i, change_id in enumerate(self.demo_changes):
+            approver, notes = approvers[i % len(approvers)]
+            approval_requests.append((change_id, approver, notes))
             
-            for i, change_id in enumerate(self.demo_changes):
-                approver, notes = approvers[i % len(approvers)]
-                
-                self.cms.request_approval(change_id, approver, notes)
-                time.sleep(0.2)
-                
-                if i < 3:
-                    self.cms.approve_change(
-                        change_id,
-                        approver,
-                        f"Approved - meets EU AI Act requirements. {notes} complete."
-                    )
-                elif i == 3:
-                    self.cms.reject_change(
-                        change_id,
-                        approver,
-                        "Insufficient testing coverage - requires additional security tests"
-                    )
-                else:
-                    pass
-                
-                progress.advance(task)
-                time.sleep(0.3)
+            if i < 3:
+                decisions.append((
+                    change_id,
+                    approver,
+                    "approve",
+                    f"Approved - meets EU AI Act requirements. {notes} complete."
+                ))
+            elif i == 3:
+                decisions.append((
+                    change_id,
+                    approver,
+                    "reject",
+                    "Insufficient testing coverage - requires additional security tests"
+                ))
+        
+        with self._progress_task("Processing approvals...", total=2) as task:
+            self.cms.bulk_request_approval(approval_requests)
+            self._invalidate(*self.demo_changes)
+            self.progress.advance(task)
+            self._pause(0.2)
+            
+            self.cms.bulk_decide(decisions)
+            self._invalidate(*self.demo_changes)
+            self.progress.advance(task)
+            self._pause(0.3)
         
         table = Table(title="Approval Status", box=box.ROUNDED, border_style="green")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -405,20 +480,16 @@ class ChangeManagementDemo:
         table.add_column("Decision", style="dim")
         
         for change_id in self.demo_changes:
-            change = self.cms._load_change(change_id)
+            change = self._get(change_id)
             if change.approvals:
                 approval = change.approvals[0]
-                status_color = {
-                    "pending": "yellow",
-                    "approved": "green",
-                    "rejected": "red"
-                }.get(approval["status"], "white")
+                status_color = APPROVAL_COLORS.get(approval["status"], "white")
                 
                 decision_text = approval.get("decision_notes") or approval.get("notes") or ""
                 decision_display = (decision_text[:40] + "...") if decision_text else "N/A"
                 
                 table.add_row(
-                    change_id[-12:],
+                    self.summaries[change_id].short_id,
                     approval["approver"].split("@")[0],
                     f"[{status_color}]{approval['status'].upper()}[/{status_color}]",
                     decision_display
@@ -429,43 +500,27 @@ class ChangeManagementDemo:
     
     def demo_deployment(self):
         """Demo: Change deployment"""
-        console.print(Panel(
-            "[bold]Demo 6: Deployment[/bold]\n"
-            "Deploying approved changes",
-            style="cyan",
-            border_style="cyan"
-        ))
+        self._phase_header(6, "Deployment", "Deploying approved changes", "cyan")
         
-        approved_changes = []
-        for change_id in self.demo_changes:
-            status = self.cms.get_change_status(change_id)
-            if status["status"] == "approved":
-                approved_changes.append(change_id)
+        approved_changes = [
+            change_id for change_id in self.demo_changes
+            if self._get(change_id).status == ChangeStatus.APPROVED.value
+        ]
         
         if not approved_changes:
             console.print("[yellow]No approved changes to deploy[/yellow]\n")
             return
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Deploying changes...", total=len(approved_changes))
+        with self._progress_task("Deploying changes...", total=len(approved_changes)) as task:
+            self.cms.deploy_batch(
+                approved_changes,
+                "ops-team@company.com",
+                notes="Deployment completed successfully. All health checks passed."
+            )
+            self._invalidate(*approved_changes)
             
-            for change_id in approved_changes:
-                deployment = self.cms.deploy_change(change_id, "ops-team@company.com")
-                time.sleep(0.5)
-                
-                success = True
-                self.cms.complete_deployment(
-                    change_id,
-                    success=success,
-                    notes="Deployment completed successfully. All health checks passed."
-                )
-                
-                progress.advance(task)
-                time.sleep(0.3)
+            self.progress.update(task, completed=len(approved_changes))
+            self._pause(0.5)
         
         table = Table(title="Deployment Results", box=box.ROUNDED, border_style="cyan")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -474,13 +529,13 @@ class ChangeManagementDemo:
         table.add_column("Result", style="green")
         
         for change_id in approved_changes:
-            change = self.cms._load_change(change_id)
+            change = self._get(change_id)
             if change.deployment_log:
                 deployment = change.deployment_log[-1]
                 status_color = "green" if deployment["status"] == "completed" else "red"
                 
                 table.add_row(
-                    change_id[-12:],
+                    self.summaries[change_id].short_id,
                     f"[{status_color}]{deployment['status'].upper()}[/{status_color}]",
                     deployment["deployed_by"].split("@")[0],
                     "✓ Success" if deployment["status"] == "completed" else "✗ Failed"
@@ -491,18 +546,12 @@ class ChangeManagementDemo:
     
     def demo_rollback(self):
         """Demo: Change rollback"""
-        console.print(Panel(
-            "[bold]Demo 7: Rollback Execution[/bold]\n"
-            "Demonstrating rollback of a deployed change",
-            style="red",
-            border_style="red"
-        ))
+        self._phase_header(7, "Rollback Execution", "Demonstrating rollback of a deployed change", "red")
         
-        deployed_changes = []
-        for change_id in self.demo_changes:
-            status = self.cms.get_change_status(change_id)
-            if status["status"] == "deployed":
-                deployed_changes.append(change_id)
+        deployed_changes = [
+            change_id for change_id in self.demo_changes
+            if self._get(change_id).status == ChangeStatus.DEPLOYED.value
+        ]
         
         if not deployed_changes:
             console.print("[yellow]No deployed changes to rollback[/yellow]\n")
@@ -510,23 +559,16 @@ class ChangeManagementDemo:
         
         rollback_change_id = deployed_changes[0]
         
-        console.print(f"[yellow]Simulating issue with {rollback_change_id[-12:]}...[/yellow]")
+        console.print(f"[yellow]Simulating issue with {self.summaries[rollback_change_id].short_id}...[/yellow]")
         console.print("[red]⚠ Performance degradation detected - initiating rollback[/red]\n")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Executing rollback...", total=None)
-            
+        with self._progress_task("Executing rollback...", total=None):
             rollback_result = self.cms.rollback_change(
                 rollback_change_id,
                 "ops-team@company.com",
                 "Performance degradation: 95th percentile latency increased by 200ms"
             )
-            
-            progress.update(task, completed=True)
+            self._invalidate(rollback_change_id)
         
         console.print(Panel(
             f"[bold green]✓ Rollback Complete[/bold green]\n\n"
@@ -540,34 +582,28 @@ class ChangeManagementDemo:
             title="Rollback Execution Report"
         ))
         
-        console.print(f"\n[green]✓ Successfully rolled back change {rollback_change_id[-12:]}[/green]\n")
+        console.print(f"\n[green]✓ Successfully rolled back change {self.summaries[rollback_change_id].short_id}[/green]\n")
     
     def demo_statistics(self):
         """Demo: Statistics and reporting"""
-        console.print(Panel(
-            "[bold]Demo 8: Statistics and Reporting[/bold]\n"
-            "Analyzing change management metrics",
-            style="yellow",
-            border_style="yellow"
-        ))
+        self._phase_header(8, "Statistics and Reporting", "Analyzing change management metrics", "yellow")
         
         all_changes = self.cms.list_changes()
         
         stats = {
             "total": len(all_changes),
-            "by_status": {},
-            "by_priority": {},
-            "by_type": {}
+            "by_status": Counter(change["status"] for change in all_changes),
+            "by_priority": Counter(change["priority"] for change in all_changes),
+            "by_type": Counter(change["change_type"] for change in all_changes)
         }
         
-        for change in all_changes:
-            status = change["status"]
-            priority = change["priority"]
-            change_type = change["change_type"]
-            
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-            stats["by_priority"][priority] = stats["by_priority"].get(priority, 0) + 1
-            stats["by_type"][change_type] = stats["by_type"].get(change_type, 0) + 1
+        # Format every row up front so each table is filled in a single pass
+        status_rows = [(STATUS_DISPLAY.get(status, status), str(count))
+                       for status, count in sorted(stats["by_status"].items())]
+        priority_rows = [(priority.upper(), str(count))
+                         for priority, count in sorted(stats["by_priority"].items())]
+        type_rows = [(TYPE_DISPLAY.get(change_type, change_type), str(count))
+                     for change_type, count in sorted(stats["by_type"].items())]
         
         layout = Layout()
         layout.split_row(
@@ -579,20 +615,20 @@ class ChangeManagementDemo:
         status_table = Table(title="By Status", box=box.SIMPLE, border_style="blue")
         status_table.add_column("Status", style="cyan")
         status_table.add_column("Count", style="white", justify="right")
-        for status, count in sorted(stats["by_status"].items()):
-            status_table.add_row(status.replace("_", " ").title(), str(count))
+        for row in status_rows:
+            status_table.add_row(*row)
         
         priority_table = Table(title="By Priority", box=box.SIMPLE, border_style="yellow")
         priority_table.add_column("Priority", style="yellow")
         priority_table.add_column("Count", style="white", justify="right")
-        for priority, count in sorted(stats["by_priority"].items()):
-            priority_table.add_row(priority.upper(), str(count))
+        for row in priority_rows:
+            priority_table.add_row(*row)
         
         type_table = Table(title="By Type", box=box.SIMPLE, border_style="magenta")
         type_table.add_column("Type", style="magenta")
         type_table.add_column("Count", style="white", justify="right")
-        for change_type, count in sorted(stats["by_type"].items()):
-            type_table.add_row(change_type.replace("_", " ").title(), str(count))
+        for row in type_rows:
+            type_table.add_row(*row)
         
         layout["status"].update(Panel(status_table, border_style="blue"))
         layout["priority"].update(Panel(priority_table, border_style="yellow"))
@@ -611,12 +647,7 @@ class ChangeManagementDemo:
     
     def demo_status_tracking(self):
         """Demo: Detailed status tracking"""
-        console.print(Panel(
-            "[bold]Demo 9: Change Status Tracking[/bold]\n"
-            "Detailed status information for all changes",
-            style="cyan",
-            border_style="cyan"
-        ))
+        self._phase_header(9, "Change Status Tracking", "Detailed status information for all changes", "cyan")
         
         table = Table(title="Complete Change Status Overview", box=box.ROUNDED, border_style="cyan")
         table.add_column("Change ID", style="cyan", no_wrap=True)
@@ -626,36 +657,38 @@ class ChangeManagementDemo:
         table.add_column("Approvals", style="blue")
         table.add_column("Rollback Ready", style="magenta")
         
+        # Rows go straight into the table as each status report is fetched;
+        # only the first report is kept for the detail panel below.
+        sample_change_id = self.demo_changes[0]
+        sample_status = None
         for change_id in self.demo_changes:
             status = self.cms.get_change_status(change_id)
-            
-            status_color = {
-                "draft": "dim",
-                "pending_approval": "yellow",
-                "approved": "green",
-                "deployed": "bold green",
-                "rejected": "red",
-                "rolled_back": "red"
-            }.get(status["status"], "white")
-            
-            table.add_row(
-                change_id[-12:],
-                status["title"][:30] + "..." if len(status["title"]) > 30 else status["title"],
-                f"[{status_color}]{status['status'].replace('_', ' ').title()}[/{status_color}]",
-                f"{status['tests_passed']}/{status['tests_run']}",
-                f"✓ {status['approvals_granted']}" if status['approvals_granted'] > 0 else f"⧗ {status['approvals_pending']}",
-                "✓" if status["rollback_plan_ready"] else "✗"
-            )
+            if change_id == sample_change_id:
+                sample_status = status
+            table.add_row(*self._status_row(change_id, status))
         
         console.print(table)
         
         console.print("\n[bold]Sample Detailed Status:[/bold]")
-        sample_status = self.cms.get_change_status(self.demo_changes[0])
         detail_text = "\n".join(f"  • {key.replace('_', ' ').title()}: {value}" 
                                 for key, value in sample_status.items())
-        console.print(Panel(detail_text, border_style="cyan", title=f"Status: {self.demo_changes[0][-12:]}"))
+        console.print(Panel(detail_text, border_style="cyan", title=f"Status: {self.summaries[sample_change_id].short_id}"))
         
         console.print(f"\n[green]✓ Status tracking complete for {len(self.demo_changes)} changes[/green]\n")
+    
+    def _status_row(self, change_id: str, status: Dict) -> tuple:
+        """Format one row of the status overview table"""
+        summary = self.summaries[change_id]
+        status_color = STATUS_COLORS.get(status["status"], "white")
+        
+        return (
+            summary.short_id,
+            summary.title_short,
+            f"[{status_color}]{STATUS_DISPLAY.get(status['status'], status['status'])}[/{status_color}]",
+            f"{status['tests_passed']}/{status['tests_run']}",
+            f"✓ {status['approvals_granted']}" if status['approvals_granted'] > 0 else f"⧗ {status['approvals_pending']}",
+            "✓" if status["rollback_plan_ready"] else "✗"
+        )
 
 
 def main():
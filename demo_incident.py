@@ -6,15 +6,17 @@ Complete demonstration of the incident management workflow.
 Shows detection, classification, timeline tracking, and remediation.
 """
 
-from incident_management import IncidentManager
+from incident_management import IncidentManager, INCIDENT_TYPE_NAMES, TIMELINE_STATUS_COLORS
 #from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor
+from demo_pacing import DemoPacer
 
 console = Console()
+_pause = DemoPacer(console).pause
+
 
 def demo():
     """Run complete incident management demo"""
@@ -38,6 +40,14 @@ def demo():
         console.print("[yellow]⚠️  AI features disabled (GEMINI_API_KEY not set)[/yellow]")
         console.print("[yellow]   Demo will work but without AI classification/suggestions[/yellow]\n")
     
+    # The two Gemini round-trips dominate the demo; run them on a worker thread so they
+    # overlap with the local steps and pacing instead of blocking the walkthrough
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_steps(manager, executor)
+
+
+def _run_steps(manager: IncidentManager, executor: ThreadPoolExecutor):
+    """Walk through the incident workflow, prefetching AI results in the background"""
     # Step 1: Create incident
     console.print("\n[bold cyan]Step 1: Creating Incident[/bold cyan]")
     console.print("[dim]Creating a test incident for demonstration...[/dim]")
@@ -55,29 +65,28 @@ def demo():
         detected_by="automated",
         metadata={"test": True, "demo": True}
     )
+    # Classification only reads the freshly created incident, so start it now
+    classification_future = executor.submit(manager.classify_severity, incident) if manager.use_ai else None
     
     console.print(f"[green]✓[/green] Created incident: [bold]{incident.id}[/bold]")
     console.print(f"Title: {incident.title}")
     console.print(f"Detected: {incident.detected_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    time.sleep(1)
+    _pause()
     
     # Step 2: Classify severity
     console.print("\n[bold cyan]Step 2: Classifying Severity (AI-Assisted)[/bold cyan]")
     console.print("[dim]Analyzing incident against EU AI Act Article 3(49) definitions...[/dim]")
     
     if manager.use_ai:
-        severity, incident_type, reporting_days = manager.classify_severity(incident)
+        severity, incident_type, reporting_days = classification_future.result()
+        # Remediation prompts use the classified severity/type, which the causal-link and
+        # timeline steps below leave untouched, so fetch suggestions while they run
+        remediation_future = executor.submit(manager.suggest_remediation, incident)
         
         if severity:
             console.print(f"[green]✓[/green] Severity: [bold]{severity.value.upper()}[/bold]")
             if incident_type:
-                type_names = {
-                    "a": "Death or Serious Harm to Health",
-                    "b": "Critical Infrastructure Disruption",
-                    "c": "Fundamental Rights Infringement",
-                    "d": "Property or Environment Harm"
-                }
-                console.print(f"[green]✓[/green] Type: [bold]{incident_type.value}[/bold] - {type_names.get(incident_type.value, 'Unknown')}")
+                console.print(f"[green]✓[/green] Type: [bold]{incident_type.value}[/bold] - {INCIDENT_TYPE_NAMES.get(incident_type, 'Unknown')}")
             console.print(f"[green]✓[/green] Reporting Deadline: [bold]{reporting_days} days[/bold]")
             console.print(f"[green]✓[/green] Serious Incident: [bold]{'Yes' if incident.is_serious else 'No'}[/bold]")
         else:
@@ -86,7 +95,7 @@ def demo():
         console.print("[yellow]⚠️  AI classification skipped (API key not available)[/yellow]")
         console.print("[dim]   In production, this would require manual classification[/dim]")
     
-    time.sleep(1)
+    _pause()
     
     # Step 3: Establish causal link
     console.print("\n[bold cyan]Step 3: Establishing Causal Link[/bold cyan]")
@@ -101,7 +110,7 @@ def demo():
     
     console.print("[green]✓[/green] Causal link established")
     console.print(f"   Established at: {incident.causal_link_established_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    time.sleep(1)
+    _pause()
     
     # Step 4: Check timeline
     console.print("\n[bold cyan]Step 4: Checking Reporting Timeline[/bold cyan]")
@@ -109,16 +118,7 @@ def demo():
     
     timeline = manager.track_reporting_timeline(incident)
     
-    # Color code the status
-    status_colors = {
-        "reported": "green",
-        "on_track": "green",
-        "warning": "yellow",
-        "urgent": "red",
-        "overdue": "bold red",
-        "partial": "yellow"
-    }
-    color = status_colors.get(timeline['status'], "white")
+    color = TIMELINE_STATUS_COLORS.get(timeline['status'], "white")
     
     console.print(f"[{color}]{timeline['message']}[/{color}]")
     
@@ -136,14 +136,14 @@ def demo():
         
         console.print(table)
     
-    time.sleep(1)
+    _pause()
     
     # Step 5: Get remediation suggestions
     console.print("\n[bold cyan]Step 5: Getting Remediation Suggestions (AI-Assisted)[/bold cyan]")
     console.print("[dim]Generating AI-suggested remediation actions...[/dim]")
     
     if manager.use_ai:
-        suggestions = manager.suggest_remediation(incident)
+        suggestions = remediation_future.result()
         
         if suggestions:
             console.print(f"[green]✓[/green] Generated {len(suggestions)} suggestions")
@@ -171,7 +171,7 @@ def demo():
         )
         console.print("[green]✓[/green] Added manual remediation action")
     
-    time.sleep(1)
+    _pause()
     
     # Step 6: Display full incident
     console.print("\n[bold cyan]Step 6: Complete Incident Summary[/bold cyan]")
@@ -195,10 +195,6 @@ def demo():
     console.print(workflow_table)
     
     # Final summary
-    # #region agent log
-    with open('/Users/jiangyuqing/geminihackathon/.cursor/debug.log', 'a') as f:
-        f.write(json.dumps({"sessionId":"debug-session","runId":"pre-fix","hypothesisId":"A","location":"demo_incident.py:196","message":"Before Panel.fit call","data":{"incident_id":incident.id},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-    # #endregion
     panel_obj = Panel.fit(
         f"[bold green]✓ Demo Complete![/bold green]\n\n"
         f"Incident ID: [bold]{incident.id}[/bold]\n"
@@ -210,10 +206,6 @@ def demo():
         title="Next Steps",
         border_style="green"
     )
-    # #region agent log
-    with open('/Users/jiangyuqing/geminihackathon/.cursor/debug.log', 'a') as f:
-        f.write(json.dumps({"sessionId":"debug-session","runId":"pre-fix","hypothesisId":"A","location":"demo_incident.py:210","message":"After Panel.fit call","data":{"panel_type":str(type(panel_obj))},"timestamp":int(__import__('time').time()*1000)}) + '\n')
-    # #endregion
     console.print()  # Print newline separately
     console.print(panel_obj)  # Print panel separately
     
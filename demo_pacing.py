@@ -0,0 +1,36 @@
+"""
+Visual pacing shared by the demo scripts.
+
+The demos sleep between steps so a person can follow along. DEMO_PACE scales
+those delays (0 disables them); without it, delays only apply when the output
+is an interactive terminal, so piped and CI runs finish without waiting.
+"""
+
+import math
+import os
+import time
+
+from rich.console import Console
+
+
+class DemoPacer:
+    """Sleeps for visual pacing, scaled by DEMO_PACE"""
+
+    def __init__(self, console: Console):
+        default = 1.0 if console.is_terminal else 0.0
+        raw = os.getenv("DEMO_PACE")
+        self.pace = default
+        if raw is not None:
+            try:
+                pace = float(raw)
+            except ValueError:
+                pace = math.nan
+            if math.isfinite(pace) and pace >= 0:
+                self.pace = pace
+            else:
+                console.print(f"[yellow]⚠️  Ignoring invalid DEMO_PACE={raw!r}, using {default:g}[/yellow]")
+
+    def pause(self, seconds: float = 1.0):
+        """Sleep for `seconds` scaled by the pace multiplier"""
+        if self.pace:
+            time.sleep(seconds * self.pace)
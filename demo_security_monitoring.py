@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
+import heapq
 import json
+import os
 import random
 import time
 from datetime import datetime
-from pathlib import Path
+from typing import List
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.table import Table
     from rich.live import Live
@@ -21,6 +24,12 @@ except ImportError:
     Table = None
     RICH_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from security_monitoring import SecurityMonitor, SecurityEvent, create_sample_event
 
 try:
@@ -33,6 +42,18 @@ except ImportError:
 
 console = Console() if RICH_AVAILABLE else None
 
+THREAT_LEVEL_COLORS = {"critical": "bold red", "high": "red", "medium": "yellow", "low": "green"}
+
+
+@functools.lru_cache(maxsize=64)
+def _load_incident(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key so a rewritten file is parsed again
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
 
 class SecurityMonitoringDemo:
     def __init__(self, use_ai: bool = True, enable_incidents: bool = True):
@@ -43,46 +64,65 @@ class SecurityMonitoringDemo:
         self.monitor = SecurityMonitor(use_ai=use_ai, incident_manager=self.incident_manager)
         self.event_count = 0
         self.threat_count = 0
+        self.rng = random.Random()
+
+    def _event_ids(self, count: int) -> List[str]:
+        start = self.event_count
+        return [f"EVT-{i:06d}" for i in range(start, start + count)]
+
+    def _ingest_batch(self, events: List[SecurityEvent]) -> None:
+        self.event_count += len(events)
+        self.threat_count += len(self.monitor.ingest_events(events))
 
     def simulate_normal_traffic(self, count: int = 10) -> None:
         endpoints = ["/api/data", "/api/users", "/api/health", "/api/metrics"]
         methods = ["GET", "POST", "PUT"]
         ips = ["192.168.1.100", "192.168.1.101", "192.168.1.102"]
         
-        for i in range(count):
-            event = create_sample_event(
-                event_id=f"EVT-{self.event_count:06d}",
-                endpoint=random.choice(endpoints),
-                method=random.choice(methods),
-                source_ip=random.choice(ips),
-                status_code=random.choice([200, 200, 200, 201, 304]),
-                response_time_ms=random.uniform(50, 300),
-                metadata={"user_id": f"user_{random.randint(1, 100)}"}
+        # Draw every random field for the batch up front, one call per field
+        rng = self.rng
+        draws = zip(
+            self._event_ids(count),
+            rng.choices(endpoints, k=count),
+            rng.choices(methods, k=count),
+            rng.choices(ips, k=count),
+            rng.choices([200, 200, 200, 201, 304], k=count),
+            [rng.uniform(50, 300) for _ in range(count)],
+            rng.choices(range(1, 101), k=count),
+        )
+        
+        events = [
+            create_sample_event(
+                event_id=event_id,
+                endpoint=endpoint,
+                method=method,
+                source_ip=source_ip,
+                status_code=status_code,
+                response_time_ms=response_time_ms,
+                metadata={"user_id": f"user_{user_id}"}
             )
-            self.event_count += 1
-            
-            threat = self.monitor.ingest_event(event)
-            if threat:
-                self.threat_count += 1
+            for event_id, endpoint, method, source_ip, status_code, response_time_ms, user_id in draws
+        ]
+        self._ingest_batch(events)
 
     def simulate_rate_limit_attack(self) -> None:
         attacker_ip = "10.0.0.666"
+        # The monitor only reads event metadata, so one dict is shared by the batch
+        metadata = {"suspicious": True}
         
-        for i in range(150):
-            event = create_sample_event(
-                event_id=f"EVT-{self.event_count:06d}",
+        events = [
+            create_sample_event(
+                event_id=event_id,
                 endpoint="/api/data",
                 method="GET",
                 source_ip=attacker_ip,
                 status_code=200,
-                response_time_ms=random.uniform(100, 200),
-                metadata={"suspicious": True}
+                response_time_ms=self.rng.uniform(100, 200),
+                metadata=metadata
             )
-            self.event_count += 1
-            
-            threat = self.monitor.ingest_event(event)
-            if threat:
-                self.threat_count += 1
+            for event_id in self._event_ids(150)
+        ]
+        self._ingest_batch(events)
 
     def simulate_sql_injection_attempt(self) -> None:
         event = create_sample_event(
@@ -123,21 +163,21 @@ class SecurityMonitoringDemo:
             self.threat_count += 1
 
     def simulate_error_spike(self) -> None:
-        for i in range(15):
-            event = create_sample_event(
-                event_id=f"EVT-{self.event_count:06d}",
+        metadata = {"error": "Internal server error"}
+        
+        events = [
+            create_sample_event(
+                event_id=event_id,
                 endpoint="/api/process",
                 method="POST",
                 source_ip="192.168.1.100",
                 status_code=500,
-                response_time_ms=random.uniform(2000, 5000),
-                metadata={"error": "Internal server error"}
+                response_time_ms=self.rng.uniform(2000, 5000),
+                metadata=metadata
             )
-            self.event_count += 1
-            
-            threat = self.monitor.ingest_event(event)
-            if threat:
-                self.threat_count += 1
+            for event_id in self._event_ids(15)
+        ]
+        self._ingest_batch(events)
 
     def run_full_demo(self) -> None:
         if RICH_AVAILABLE:
@@ -203,16 +243,16 @@ class SecurityMonitoringDemo:
             for level in ["critical", "high", "medium", "low"]:
                 count = summary["by_threat_level"].get(level, 0)
                 if count > 0:
-                    color = {"critical": "bold red", "high": "red", "medium": "yellow", "low": "green"}.get(level, "white")
+                    color = THREAT_LEVEL_COLORS.get(level, "white")
                     threat_table.add_row(f"[{color}]{level.upper()}[/{color}]", str(count))
             
             console.print(threat_table)
             
             if summary["critical_threats"] or summary["high_threats"]:
-                console.print("\n[bold red]Critical/High Severity Threats:[/bold red]")
-                
-                for threat in summary["critical_threats"][:3]:
-                    console.print(Panel(
+                # Build every panel first and hand Rich a single Group, so the section is laid
+                # out and written in one pass; the text is our own markup, so skip highlighting
+                panels = [
+                    Panel(
                         f"[bold]ID:[/bold] {threat['detection_id']}\n"
                         f"[bold]Category:[/bold] {threat['category']}\n"
                         f"[bold]Description:[/bold] {threat['description'][:200]}...\n"
@@ -220,28 +260,37 @@ class SecurityMonitoringDemo:
                         f"[bold]EU AI Act:[/bold] {threat['eu_ai_act_article']}",
                         title=f"[red]CRITICAL: {threat['title']}[/red]",
                         border_style="red"
-                    ))
-                
-                for threat in summary["high_threats"][:2]:
-                    console.print(Panel(
+                    )
+                    for threat in summary["critical_threats"][:3]
+                ]
+                panels += [
+                    Panel(
                         f"[bold]ID:[/bold] {threat['detection_id']}\n"
                         f"[bold]Category:[/bold] {threat['category']}\n"
                         f"[bold]Description:[/bold] {threat['description'][:200]}...\n"
                         f"[bold]Confidence:[/bold] {threat['confidence_score']:.2%}",
                         title=f"[yellow]HIGH: {threat['title']}[/yellow]",
                         border_style="yellow"
-                    ))
+                    )
+                    for threat in summary["high_threats"][:2]
+                ]
+                console.print("\n[bold red]Critical/High Severity Threats:[/bold red]")
+                console.print(Group(*panels), highlight=False)
             
             if self.incident_manager and INCIDENT_MGMT_AVAILABLE:
                 console.print("\n[bold cyan]EU AI Act Article 73 Incidents Created:[/bold cyan]")
-                incidents_dir = Path("incidents")
+                incidents_dir = self.incident_manager.incidents_dir
                 if incidents_dir.exists():
-                    incident_files = list(incidents_dir.glob("*.json"))
-                    console.print(f"Total incidents: {len(incident_files)}")
+                    with os.scandir(incidents_dir) as it:
+                        incident_entries = [e for e in it if e.name.endswith(".json")]
+                    console.print(f"Total incidents: {len(incident_entries)}")
                     
-                    for inc_file in sorted(incident_files, reverse=True)[:3]:
-                        with open(inc_file) as f:
-                            inc_data = json.load(f)
+                    # Only the three newest are shown, so pick them by filename
+                    # (incident IDs start with the creation time) without
+                    # sorting or parsing the rest.
+                    newest = heapq.nlargest(3, incident_entries, key=lambda e: e.name)
+                    for entry in newest:
+                        inc_data = _load_incident(entry.path, entry.stat().st_mtime_ns)
                         console.print(f"  • {inc_data['id']}: {inc_data['title']}")
         else:
             print("\n" + "=" * 60)
@@ -13,21 +13,33 @@ Usage:
 """
 
 import sys
-from pathlib import Path
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
-from datetime import datetime
 
 from incident_management import (
-    IncidentManager, Incident, IncidentSeverity, 
-    SeriousIncidentType, IncidentStatus
+    IncidentManager, Incident, IncidentSeverity, IncidentStatus, TIMELINE_STATUS_COLORS
 )
 
 console = Console()
 
+# Filter values accepted by `list`, resolved with a dict lookup instead of try/except
+STATUSES_BY_VALUE = {status.value: status for status in IncidentStatus}
+SEVERITIES_BY_VALUE = {severity.value: severity for severity in IncidentSeverity}
+
+def read_multiline(prompt: str) -> str:
+    """Read lines until a blank line or EOF; pasted text arrives through stdin's own buffering"""
+    console.print(f"{prompt} [dim](finish with an empty line)[/dim]:")
+    lines = []
+    readline = sys.stdin.readline
+    while True:
+        line = readline().rstrip("\n")
+        if not line:
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
 def print_header():
     """Print CLI header"""
     console.print(Panel.fit(
@@ -40,21 +52,31 @@ def print_header():
         border_style="cyan"
     ))
 
+def _list_row(incident: Incident, timeline: dict) -> tuple:
+    """Cells for one incident in the `list` table"""
+    timeline_color = TIMELINE_STATUS_COLORS.get(timeline['status'], "white")
+    return (
+        incident.id,
+        incident.short_title,
+        incident.severity.value if incident.severity else "Unclassified",
+        incident.status.value,
+        f"[{timeline_color}]{timeline['message']}[/{timeline_color}]",
+        incident.detected_at.strftime('%Y-%m-%d %H:%M')
+    )
+
 def cmd_list(manager: IncidentManager, status: str = None, severity: str = None):
     """List all incidents"""
     status_enum = None
     if status:
-        try:
-            status_enum = IncidentStatus(status.lower())
-        except ValueError:
+        status_enum = STATUSES_BY_VALUE.get(status.lower())
+        if status_enum is None:
             console.print(f"[red]Invalid status: {status}[/red]")
             return
     
     severity_enum = None
     if severity:
-        try:
-            severity_enum = IncidentSeverity(severity.lower())
-        except ValueError:
+        severity_enum = SEVERITIES_BY_VALUE.get(severity.lower())
+        if severity_enum is None:
             console.print(f"[red]Invalid severity: {severity}[/red]")
             return
     
@@ -72,34 +94,18 @@ def cmd_list(manager: IncidentManager, status: str = None, severity: str = None)
     table.add_column("Timeline", style="magenta")
     table.add_column("Detected", style="dim")
     
-    for incident in incidents:
-        timeline = manager.track_reporting_timeline(incident)
-        severity_str = incident.severity.value if incident.severity else "Unclassified"
-        status_str = incident.status.value
-        
-        # Color code timeline status
-        timeline_color = {
-            "reported": "green",
-            "on_track": "green",
-            "warning": "yellow",
-            "urgent": "red",
-            "overdue": "bold red",
-            "partial": "yellow"
-        }.get(timeline['status'], "white")
-        
-        timeline_str = f"[{timeline_color}]{timeline['message']}[/{timeline_color}]"
-        
-        table.add_row(
-            incident.id,
-            incident.title[:40] + "..." if len(incident.title) > 40 else incident.title,
-            severity_str,
-            status_str,
-            timeline_str,
-            incident.detected_at.strftime('%Y-%m-%d %H:%M')
-        )
+    # Format every row first, then fill the table in one tight loop; the table is printed once
+    timelines = manager.track_reporting_timelines(incidents)
+    rows = [_list_row(incident, timelines[incident.id]) for incident in incidents]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
+def _bullet_list(items: list) -> str:
+    """One "• item" line per entry"""
+    return "• " + "\n• ".join(items)
+
 def cmd_show(manager: IncidentManager, incident_id: str):
     """Show detailed incident information"""
     incident = manager.load_incident(incident_id)
@@ -109,34 +115,38 @@ def cmd_show(manager: IncidentManager, incident_id: str):
     
     manager.display_incident(incident)
     
-    # Additional details
+    # Additional details, collected and printed as one group
+    panels = []
     if incident.investigation_notes:
-        console.print(Panel(
-            "\n".join(f"• {note}" for note in incident.investigation_notes),
+        panels.append(Panel(
+            _bullet_list(incident.investigation_notes),
             title="Investigation Notes",
             border_style="blue"
         ))
     
     if incident.corrective_actions:
-        console.print(Panel(
-            "\n".join(f"• {action}" for action in incident.corrective_actions),
+        panels.append(Panel(
+            _bullet_list(incident.corrective_actions),
             title="Corrective Actions",
             border_style="green"
         ))
     
     if incident.risk_assessment:
-        console.print(Panel(
+        panels.append(Panel(
             incident.risk_assessment,
             title="Risk Assessment",
             border_style="red"
         ))
+    
+    if panels:
+        console.print(Group(*panels))
 
 def cmd_create(manager: IncidentManager):
     """Create a new incident interactively"""
     console.print("\n[bold cyan]Create New Incident[/bold cyan]\n")
     
     title = Prompt.ask("Incident Title")
-    description = Prompt.ask("Description", multiline=True)
+    description = read_multiline("Description")
     ai_system_id = Prompt.ask("AI System ID")
     ai_system_name = Prompt.ask("AI System Name")
     member_state = Prompt.ask("Member State (EU)", default="Germany")
@@ -270,36 +280,57 @@ def cmd_report(manager: IncidentManager, incident_id: str):
     console.print(f"\n[bold cyan]Submit Report for {incident.id}[/bold cyan]\n")
     
     report_type = Prompt.ask("Report Type", choices=["initial", "complete"], default="complete")
-    report_content = Prompt.ask("Report Content", multiline=True)
+    report_content = read_multiline("Report Content")
+    operations = [(report_type, incident, report_content)]
+    
+    try:
+        # Ask about authority notification
+        if Confirm.ask("\nNotify market surveillance authority?"):
+            authority_contact = Prompt.ask("Authority Contact (email/phone)")
+            notification_content = read_multiline("Notification Content")
+            operations.append(("notify", incident, authority_contact, notification_content))
+    finally:
+        # Apply everything together so the incident file is written once; this also
+        # runs when the notification prompts are interrupted, so the report is kept
+        manager.submit_batch(operations)
+        if report_type == "initial":
+            console.print("[green]✓ Initial report submitted[/green]")
+        else:
+            console.print("[green]✓ Complete report submitted[/green]")
     
-    if report_type == "initial":
-        manager.submit_initial_report(incident, report_content)
-        console.print("[green]✓ Initial report submitted[/green]")
-    else:
-        manager.submit_complete_report(incident, report_content)
-        console.print("[green]✓ Complete report submitted[/green]")
-    
-    # Ask about authority notification
-    if Confirm.ask("\nNotify market surveillance authority?"):
-        authority_contact = Prompt.ask("Authority Contact (email/phone)")
-        notification_content = Prompt.ask("Notification Content", multiline=True)
-        manager.notify_authority(incident, authority_contact, notification_content)
+    if len(operations) > 1:
         console.print("[green]✓ Authority notified[/green]")
 
+# Printed before every interactive prompt; built once rather than line by line per loop
+COMMAND_MENU = "\n".join([
+    "\n[bold cyan]Commands:[/bold cyan]",
+    "  [dim]list[/dim]          - List all incidents",
+    "  [dim]show <id>[/dim]     - Show incident details",
+    "  [dim]create[/dim]         - Create new incident",
+    "  [dim]classify <id>[/dim] - Classify incident severity",
+    "  [dim]remediate <id>[/dim] - Get remediation suggestions",
+    "  [dim]timeline <id>[/dim] - Show reporting timeline",
+    "  [dim]report <id>[/dim]   - Submit incident report",
+    "  [dim]exit[/dim]          - Exit\n",
+])
+
+# Commands that take an incident id, dispatched by name
+INCIDENT_COMMANDS = {
+    "show": cmd_show,
+    "classify": cmd_classify,
+    "remediate": cmd_remediate,
+    "timeline": cmd_timeline,
+    "report": cmd_report,
+}
+# The non-interactive subset available as `incident_cli.py <command> <id>`
+CLI_INCIDENT_COMMANDS = frozenset(("show", "classify", "timeline"))
+
 def interactive_mode(manager: IncidentManager):
     """Run interactive mode"""
     print_header()
     
     while True:
-        console.print("\n[bold cyan]Commands:[/bold cyan]")
-        console.print("  [dim]list[/dim]          - List all incidents")
-        console.print("  [dim]show <id>[/dim]     - Show incident details")
-        console.print("  [dim]create[/dim]         - Create new incident")
-        console.print("  [dim]classify <id>[/dim] - Classify incident severity")
-        console.print("  [dim]remediate <id>[/dim] - Get remediation suggestions")
-        console.print("  [dim]timeline <id>[/dim] - Show reporting timeline")
-        console.print("  [dim]report <id>[/dim]   - Submit incident report")
-        console.print("  [dim]exit[/dim]          - Exit\n")
+        console.print(COMMAND_MENU)
         
         try:
             cmd_input = Prompt.ask("[bold green]Command[/bold green]").strip().split()
@@ -312,18 +343,10 @@ def interactive_mode(manager: IncidentManager):
                 break
             elif cmd == "list":
                 cmd_list(manager)
-            elif cmd == "show" and len(cmd_input) > 1:
-                cmd_show(manager, cmd_input[1])
             elif cmd == "create":
                 cmd_create(manager)
-            elif cmd == "classify" and len(cmd_input) > 1:
-                cmd_classify(manager, cmd_input[1])
-            elif cmd == "remediate" and len(cmd_input) > 1:
-                cmd_remediate(manager, cmd_input[1])
-            elif cmd == "timeline" and len(cmd_input) > 1:
-                cmd_timeline(manager, cmd_input[1])
-            elif cmd == "report" and len(cmd_input) > 1:
-                cmd_report(manager, cmd_input[1])
+            elif cmd in INCIDENT_COMMANDS and len(cmd_input) > 1:
+                INCIDENT_COMMANDS[cmd](manager, cmd_input[1])
             else:
                 console.print("[red]Invalid command. Type 'exit' to quit.[/red]")
         except KeyboardInterrupt:
@@ -343,8 +366,8 @@ def main():
             status = sys.argv[2] if len(sys.argv) > 2 else None
             severity = sys.argv[3] if len(sys.argv) > 3 else None
             cmd_list(manager, status, severity)
-        elif cmd == "show" and len(sys.argv) > 2:
-            cmd_show(manager, sys.argv[2])
+        elif cmd in CLI_INCIDENT_COMMANDS and len(sys.argv) > 2:
+            INCIDENT_COMMANDS[cmd](manager, sys.argv[2])
         elif cmd == "create":
             if len(sys.argv) < 7:
                 console.print("[red]Usage: python incident_cli.py create \"Title\" \"Description\" \"AI-SYS-001\" \"System Name\" \"Germany\"[/red]")
@@ -358,10 +381,6 @@ def main():
             )
             console.print(f"[green]Created: {incident.id}[/green]")
             manager.display_incident(incident)
-        elif cmd == "classify" and len(sys.argv) > 2:
-            cmd_classify(manager, sys.argv[2])
-        elif cmd == "timeline" and len(sys.argv) > 2:
-            cmd_timeline(manager, sys.argv[2])
         else:
             console.print("[red]Invalid command. Use 'python incident_cli.py' for interactive mode.[/red]")
     else:
@@ -20,17 +20,20 @@ Usage:
     manager.track_reporting_timeline(incident)
 """
 
+import copy
+import hashlib
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
 
 try:
     from google import genai
@@ -43,6 +46,8 @@ except ImportError:
 BASE_DIR = Path(__file__).resolve().parent
 INCIDENTS_DIR = BASE_DIR / "incidents"
 INCIDENTS_DIR.mkdir(exist_ok=True)
+# Gemini responses keyed by SHA-256 of the prompt, so re-running on identical incidents skips the API
+AI_CACHE_DIR = BASE_DIR / ".ai_cache"
 
 # EU AI Act Article 3, point (49) - Serious Incident Definition
 class SeriousIncidentType(Enum):
@@ -69,6 +74,24 @@ class IncidentStatus(Enum):
     RESOLVED = "resolved"
     CLOSED = "closed"
 
+# Display labels for Article 3(49) incident types
+INCIDENT_TYPE_NAMES = {
+    SeriousIncidentType.DEATH_OR_SERIOUS_HARM: "Death or Serious Harm to Health",
+    SeriousIncidentType.CRITICAL_INFRASTRUCTURE_DISRUPTION: "Critical Infrastructure Disruption",
+    SeriousIncidentType.FUNDAMENTAL_RIGHTS_INFRINGEMENT: "Fundamental Rights Infringement",
+    SeriousIncidentType.PROPERTY_ENVIRONMENT_HARM: "Property or Environment Harm",
+}
+
+# Rich styles for the statuses returned by track_reporting_timeline()
+TIMELINE_STATUS_COLORS = {
+    "reported": "green",
+    "on_track": "green",
+    "warning": "yellow",
+    "urgent": "red",
+    "overdue": "bold red",
+    "partial": "yellow",
+}
+
 @dataclass
 class Incident:
     """Incident data structure for EU AI Act Article 73 compliance"""
@@ -117,6 +140,22 @@ class Incident:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: Dict = field(default_factory=dict)
+    
+    @cached_property
+    def short_title(self) -> str:
+        """Title truncated to 40 characters for table columns"""
+        return self.title[:40] + "..." if len(self.title) > 40 else self.title
+
+def _copy_incident(incident: Incident) -> Incident:
+    """Copy an incident so that changes to the copy never reach the original"""
+    clone = copy.copy(incident)
+    clone.__dict__.pop("short_title", None)
+    clone.remediation_actions = list(incident.remediation_actions)
+    clone.corrective_actions = list(incident.corrective_actions)
+    clone.investigation_notes = list(incident.investigation_notes)
+    clone.metadata = copy.deepcopy(incident.metadata)
+    return clone
+
 
 class IncidentManager:
     """Manages incident detection, classification, tracking, and reporting for EU AI Act Article 73"""
@@ -124,6 +163,11 @@ class IncidentManager:
     def __init__(self, use_ai: bool = True):
         self.console = Console()
         self.incidents_dir = INCIDENTS_DIR
+        # incident id -> ((file mtime_ns, size), Incident); entries are reused until the file
+        # changes. The cached objects are private: loads hand out copies of them.
+        self._incident_cache: Dict[str, Tuple[Tuple[int, int], Incident]] = {}
+        # Incidents saved inside batch_writes(), written once when the block exits
+        self._pending_incidents: Optional[Dict[str, Incident]] = None
         self.use_ai = use_ai and genai is not None
         self.client = None
         
@@ -203,6 +247,30 @@ class IncidentManager:
         
         return incident.severity, incident.incident_type, reporting_days
     
+    def _ai_cache_path(self, kind: str, prompt: str) -> Path:
+        """Location of the cached response for a prompt"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return AI_CACHE_DIR / f"{kind}-{digest}.json"
+    
+    def _load_ai_cache(self, path: Path):
+        """Return a cached AI response, or None if missing or unreadable"""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_ai_cache(self, path: Path, data) -> None:
+        """Persist an AI response; caching is best-effort and never fails the caller"""
+        try:
+            AI_CACHE_DIR.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
     def _ai_classify_incident(self, incident: Incident) -> Dict:
         """Use AI to classify incident severity and type"""
         prompt = f"""You are an expert on EU AI Act Article 73 compliance. Classify the following incident according to Article 3, point (49) definitions.
@@ -231,24 +299,28 @@ Classify this incident and return JSON with:
 
 Return only valid JSON, no markdown formatting."""
 
+        cache_path = self._ai_cache_path("sev", prompt)
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash-exp",
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=0.1)
-            )
-            
-            # Parse JSON response
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
-            
-            classification = json.loads(response_text)
+            classification = self._load_ai_cache(cache_path)
+            if not isinstance(classification, dict):
+                response = self.client.models.generate_content(
+                    model="gemini-2.0-flash-exp",
+                    contents=prompt,
+                    config=types.GenerateContentConfig(temperature=0.1)
+                )
+                
+                # Parse JSON response
+                response_text = response.text.strip()
+                if response_text.startswith("```json"):
+                    response_text = response_text[7:]
+                if response_text.startswith("```"):
+                    response_text = response_text[3:]
+                if response_text.endswith("```"):
+                    response_text = response_text[:-3]
+                response_text = response_text.strip()
+                
+                classification = json.loads(response_text)
+                self._save_ai_cache(cache_path, classification)
             
             # Convert to enums
             severity_map = {
@@ -328,6 +400,11 @@ AI System: {incident.ai_system_name}
 Provide a JSON array of remediation action suggestions. Each action should be specific and actionable.
 Return only valid JSON array, no markdown formatting."""
 
+        cache_path = self._ai_cache_path("rem", prompt)
+        cached = self._load_ai_cache(cache_path)
+        if isinstance(cached, list):
+            return cached
+        
         try:
             response = self.client.models.generate_content(
                 model="gemini-2.0-flash-exp",
@@ -345,7 +422,9 @@ Return only valid JSON array, no markdown formatting."""
             response_text = response_text.strip()
             
             actions = json.loads(response_text)
-            return actions if isinstance(actions, list) else [str(actions)]
+            actions = actions if isinstance(actions, list) else [str(actions)]
+            self._save_ai_cache(cache_path, actions)
+            return actions
         except Exception as e:
             self.console.print(f"[yellow]AI remediation suggestion error: {e}[/yellow]")
             return [
@@ -364,9 +443,10 @@ Return only valid JSON array, no markdown formatting."""
         incident.updated_at = datetime.now()
         self.save_incident(incident)
     
-    def track_reporting_timeline(self, incident: Incident) -> Dict:
+    def track_reporting_timeline(self, incident: Incident, now: Optional[datetime] = None) -> Dict:
         """Track reporting timeline and return status"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
         if not incident.reporting_deadline:
             return {
@@ -374,8 +454,9 @@ Return only valid JSON array, no markdown formatting."""
                 "message": "Reporting deadline not set. Classify incident first."
             }
         
-        days_remaining = (incident.reporting_deadline - now).days
-        hours_remaining = (incident.reporting_deadline - now).total_seconds() / 3600
+        remaining = incident.reporting_deadline - now
+        days_remaining = remaining.days
+        hours_remaining = remaining.total_seconds() / 3600
         
         if incident.complete_report_submitted:
             status = "reported"
@@ -405,6 +486,13 @@ Return only valid JSON array, no markdown formatting."""
             "timeline_days": incident.reporting_timeline_days
         }
     
+    def track_reporting_timelines(self, incidents: List[Incident], now: Optional[datetime] = None) -> Dict[str, Dict]:
+        """Timeline status for several incidents against one shared "now", keyed by incident id"""
+        if now is None:
+            now = datetime.now()
+        track = self.track_reporting_timeline
+        return {incident.id: track(incident, now) for incident in incidents}
+    
     def submit_initial_report(self, incident: Incident, report_content: str) -> None:
         """Submit initial incomplete report (Article 73(5))"""
         incident.initial_report_submitted = True
@@ -455,8 +543,50 @@ Return only valid JSON array, no markdown formatting."""
         incident.updated_at = datetime.now()
         self.save_incident(incident)
     
+    def submit_batch(self, operations: List[Tuple]) -> None:
+        """Apply several report/notification operations, saving each incident once.
+        
+        Operations are applied in order and are one of
+        ("initial", incident, content), ("complete", incident, content) or
+        ("notify", incident, authority_contact, content).
+        """
+        handlers = {
+            "initial": self.submit_initial_report,
+            "complete": self.submit_complete_report,
+            "notify": self.notify_authority,
+        }
+        with self.batch_writes():
+            for kind, incident, *args in operations:
+                handlers[kind](incident, *args)
+    
+    @contextmanager
+    def batch_writes(self):
+        """Defer incident JSON writes until the block exits.
+        
+        Inside the block each incident is written at most once, with its final
+        state; load_incident returns the buffered copy. Report and notification
+        text files are still written immediately. Not meant to be shared
+        between threads.
+        """
+        if self._pending_incidents is not None:
+            yield
+            return
+        
+        self._pending_incidents = {}
+        try:
+            yield
+        finally:
+            pending = self._pending_incidents
+            self._pending_incidents = None
+            for incident in pending.values():
+                self.save_incident(incident)
+    
     def save_incident(self, incident: Incident) -> None:
         """Save incident to JSON file"""
+        if self._pending_incidents is not None:
+            self._pending_incidents[incident.id] = incident
+            return
+        
         incident_file = self.incidents_dir / f"{incident.id}.json"
         
         # Convert to dict, handling datetime and enum serialization
@@ -483,12 +613,30 @@ Return only valid JSON array, no markdown formatting."""
         incident_dict['status'] = incident.status.value
         
         incident_file.write_text(json.dumps(incident_dict, indent=2), encoding='utf-8')
+        st = incident_file.stat()
+        self._incident_cache[incident.id] = ((st.st_mtime_ns, st.st_size), _copy_incident(incident))
     
     def load_incident(self, incident_id: str) -> Optional[Incident]:
-        """Load incident from JSON file"""
+        """Load incident from JSON file, reusing the last parsed copy while the file is unchanged
+        
+        Each call returns its own copy, so changing it without save_incident
+        does not affect later loads.
+        """
+        if self._pending_incidents is not None and incident_id in self._pending_incidents:
+            return self._pending_incidents[incident_id]
+        
         incident_file = self.incidents_dir / f"{incident_id}.json"
-        if not incident_file.exists():
+        try:
+            st = incident_file.stat()
+        except FileNotFoundError:
+            self._incident_cache.pop(incident_id, None)
             return None
+        # Size as well as mtime, so a rewrite within one coarse mtime tick is still noticed
+        signature = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._incident_cache.get(incident_id)
+        if cached and cached[0] == signature:
+            return _copy_incident(cached[1])
         
         incident_dict = json.loads(incident_file.read_text(encoding='utf-8'))
         
@@ -514,7 +662,9 @@ Return only valid JSON array, no markdown formatting."""
             incident_dict['incident_type'] = SeriousIncidentType(incident_dict['incident_type'])
         incident_dict['status'] = IncidentStatus(incident_dict['status'])
         
-        return Incident(**incident_dict)
+        incident = Incident(**incident_dict)
+        self._incident_cache[incident_id] = (signature, _copy_incident(incident))
+        return incident
     
     def list_incidents(self, status: Optional[IncidentStatus] = None, severity: Optional[IncidentSeverity] = None) -> List[Incident]:
         """List all incidents, optionally filtered"""
@@ -540,14 +690,7 @@ Return only valid JSON array, no markdown formatting."""
         timeline = self.track_reporting_timeline(incident)
         
         # Status panel
-        status_color = {
-            "reported": "green",
-            "on_track": "green",
-            "warning": "yellow",
-            "urgent": "red",
-            "overdue": "bold red",
-            "partial": "yellow"
-        }.get(timeline['status'], "white")
+        status_color = TIMELINE_STATUS_COLORS.get(timeline['status'], "white")
         
         self.console.print(Panel.fit(
             f"[bold]{incident.title}[/bold]\n\n"
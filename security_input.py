@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import html
 import re
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 class InputValidationError(ValueError):
@@ -18,24 +20,60 @@ class RateLimitConfig:
 
 
 class InMemoryRateLimiter:
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    # Token bucket per key, kept in integer units: one token is worth
+    # per_seconds * 1e9 units and each elapsed nanosecond refills `requests`
+    # units, so refill needs no float math. Buckets start full.
+    # Time comes from time.monotonic_ns(); callers that pass now_ns (tests,
+    # replays) must use that same clock, not wall-clock time.time().
+    # thread_safe=True (the default, for the threaded webhook server) guards
+    # each call with a lock; False leaves _lock as None so single-threaded
+    # callers such as benchmarks skip the acquire/release.
+    __slots__ = ("config", "_token_units", "_capacity_units", "_state", "_lock")
+
+    def __init__(self, config: Optional[RateLimitConfig] = None, thread_safe: bool = True):
         self.config = config or RateLimitConfig()
-        self._buckets: Dict[str, list[float]] = {}
-
-    def allow(self, key: str, now: Optional[float] = None) -> bool:
-        current = time.time() if now is None else now
-        window_start = current - float(self.config.per_seconds)
-        bucket = self._buckets.get(key, [])
-        bucket = [t for t in bucket if t >= window_start]
-
-        if len(bucket) >= self.config.requests:
-            self._buckets[key] = bucket
-            return False
-
-        bucket.append(current)
-        self._buckets[key] = bucket
-        return True
-
+        self._token_units = self.config.per_seconds * 1_000_000_000
+        self._capacity_units = self.config.requests * self._token_units
+        self._state: Dict[str, list[int]] = {}
+        self._lock = threading.Lock() if thread_safe else None
+
+    def _refilled(self, key: str, current: int) -> list[int]:
+        state = self._state.get(key)
+        if state is None:
+            state = self._state[key] = [self._capacity_units, current]
+        else:
+            refill = (current - state[1]) * self.config.requests
+            if refill > 0:
+                capacity = self._capacity_units
+                tokens = state[0] + refill
+                state[0] = tokens if tokens < capacity else capacity
+                state[1] = current
+        return state
+
+    def _take(self, key: str, n: int, now_ns: Optional[int]) -> int:
+        current = time.monotonic_ns() if now_ns is None else now_ns
+        state = self._refilled(key, current)
+        token_units = self._token_units
+
+        allowed = min(n, state[0] // token_units)
+        state[0] -= allowed * token_units
+        return allowed
+
+    def allow(self, key: str, now_ns: Optional[int] = None) -> bool:
+        lock = self._lock
+        if lock is None:
+            return self._take(key, 1, now_ns) == 1
+        with lock:
+            return self._take(key, 1, now_ns) == 1
+
+    def allow_batch(self, key: str, n: int, now_ns: Optional[int] = None) -> int:
+        # Same outcome as n allow() calls at one instant; returns how many were allowed.
+        n = max(n, 0)
+        lock = self._lock
+        if lock is None:
+            return self._take(key, n, now_ns)
+        with lock:
+            return self._take(key, n, now_ns)
 
 _CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 
@@ -49,53 +87,81 @@ def sanitize_text(value: str, max_len: int = 10_000) -> str:
     return html.escape(cleaned, quote=True)
 
 
+GrafanaValidator = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Dict[str, Any]]]
+
+
+def compile_grafana_validator(
+    max_alerts: int = 200,
+    max_key_len: int = 128,
+    max_label_len: int = 2048,
+    max_annotation_len: int = 4096,
+) -> GrafanaValidator:
+    # Limits and helpers are bound as closure locals so the per-call path does
+    # no global or keyword lookups; build once and reuse the returned function.
+    # Label and annotation values repeat heavily across alerts (severity,
+    # ai_system, ...), so sanitized values are memoized in a bounded cache.
+    valid_statuses = frozenset(("firing", "resolved"))
+    scalar_types = (str, int, float, bool)
+    strip_controls = _CONTROL_CHARS_RE.sub
+    escape = html.escape
+
+    @functools.lru_cache(maxsize=4096)
+    def clean(value: str) -> str:
+        return escape(strip_controls("", value), quote=True)
+
+    def sanitize_mapping(mapping: Dict[Any, Any], max_len: int) -> Dict[str, str]:
+        return {
+            str(k)[:max_key_len]: clean(str(v)[:max_len])
+            for k, v in mapping.items()
+            if isinstance(v, scalar_types)
+        }
+
+    def validate(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if not isinstance(payload, dict):
+            raise InputValidationError("Payload must be a JSON object")
+
+        status = payload.get("status")
+        if status not in valid_statuses:
+            raise InputValidationError("Invalid or missing 'status'")
+
+        alerts = payload.get("alerts")
+        if not isinstance(alerts, list):
+            raise InputValidationError("Invalid or missing 'alerts' array")
+
+        if len(alerts) > max_alerts:
+            raise InputValidationError("Too many alerts in one request")
+
+        normalized_alerts = []
+        for alert in alerts:
+            if not isinstance(alert, dict):
+                raise InputValidationError("Each alert must be an object")
+
+            labels = alert.get("labels")
+            annotations = alert.get("annotations")
+            if labels is not None and not isinstance(labels, dict):
+                raise InputValidationError("Alert 'labels' must be an object")
+            if annotations is not None and not isinstance(annotations, dict):
+                raise InputValidationError("Alert 'annotations' must be an object")
+
+            normalized = dict(alert)
+            normalized["labels"] = sanitize_mapping(labels, max_label_len) if labels else {}
+            normalized["annotations"] = sanitize_mapping(annotations, max_annotation_len) if annotations else {}
+            normalized_alerts.append(normalized)
+
+        safe_payload = dict(payload)
+        safe_payload["alerts"] = normalized_alerts
+
+        metadata = {
+            "status": status,
+            "alerts_count": len(normalized_alerts),
+        }
+        return safe_payload, metadata
+
+    return validate
+
+
+_GRAFANA_VALIDATOR = compile_grafana_validator()
+
+
 def validate_grafana_alert_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    if not isinstance(payload, dict):
-        raise InputValidationError("Payload must be a JSON object")
-
-    status = payload.get("status")
-    if status not in {"firing", "resolved"}:
-        raise InputValidationError("Invalid or missing 'status'")
-
-    alerts = payload.get("alerts")
-    if not isinstance(alerts, list):
-        raise InputValidationError("Invalid or missing 'alerts' array")
-
-    if len(alerts) > 200:
-        raise InputValidationError("Too many alerts in one request")
-
-    normalized_alerts = []
-    for alert in alerts:
-        if not isinstance(alert, dict):
-            raise InputValidationError("Each alert must be an object")
-
-        labels = alert.get("labels")
-        annotations = alert.get("annotations")
-        if labels is not None and not isinstance(labels, dict):
-            raise InputValidationError("Alert 'labels' must be an object")
-        if annotations is not None and not isinstance(annotations, dict):
-            raise InputValidationError("Alert 'annotations' must be an object")
-
-        safe_labels = {}
-        for k, v in (labels or {}).items():
-            if isinstance(v, (str, int, float, bool)):
-                safe_labels[str(k)[:128]] = sanitize_text(str(v), max_len=2048)
-
-        safe_annotations = {}
-        for k, v in (annotations or {}).items():
-            if isinstance(v, (str, int, float, bool)):
-                safe_annotations[str(k)[:128]] = sanitize_text(str(v), max_len=4096)
-
-        normalized = dict(alert)
-        normalized["labels"] = safe_labels
-        normalized["annotations"] = safe_annotations
-        normalized_alerts.append(normalized)
-
-    safe_payload = dict(payload)
-    safe_payload["alerts"] = normalized_alerts
-
-    metadata = {
-        "status": status,
-        "alerts_count": len(normalized_alerts),
-    }
-    return safe_payload, metadata
+    return _GRAFANA_VALIDATOR(payload)
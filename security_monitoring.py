@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
@@ -19,6 +20,22 @@ except ImportError:
     GENAI_AVAILABLE = False
     genai = None
 
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Checked in order; the first matching pattern determines the reported attack type
+SUSPICIOUS_PATTERNS: List[Tuple[str, List[str]]] = [
+    ("sql_injection", ["' OR ", "UNION SELECT", "DROP TABLE", "; --"]),
+    ("xss_attempt", ["<script>", "javascript:", "onerror=", "onload="]),
+    ("path_traversal", ["../", "..\\", "%2e%2e"]),
+    ("command_injection", ["; ls", "| cat", "&& whoami", "`id`"]),
+]
+_SUSPICIOUS_LOWERED = [(attack_type, [p.lower() for p in patterns]) for attack_type, patterns in SUSPICIOUS_PATTERNS]
+# One alternation over every pattern, so clean payloads (the common case) cost a single scan
+_SUSPICIOUS_ANY = _regex.compile("|".join(re.escape(p) for _, patterns in _SUSPICIOUS_LOWERED for p in patterns))
+
 
 class ThreatLevel(Enum):
     CRITICAL = "critical"
@@ -74,7 +91,13 @@ class AnomalyDetector:
         self.window_size = window_size
         self.event_history: deque = deque(maxlen=window_size)
         self.baseline_stats: Dict[str, Any] = {}
-        self.ip_request_counts: Dict[str, deque] = defaultdict(lambda: deque(maxlen=60))
+        # source IP -> request timestamps inside the sliding window; entries that fall out
+        # of the window are popped from the left, so each timestamp is touched twice at most
+        self.ip_request_times: Dict[str, deque] = defaultdict(deque)
+        # source IP -> when its last rate violation was raised; one detection per window
+        self.ip_rate_flagged_at: Dict[str, float] = {}
+        self.rate_window_s = 60.0
+        self.rate_threshold = 100
         self.endpoint_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {"count": 0, "avg_time": 0.0, "max_time": 0.0})
 
     def add_event(self, event: SecurityEvent) -> None:
@@ -89,8 +112,12 @@ class AnomalyDetector:
         stats["avg_time"] = (stats["avg_time"] * (stats["count"] - 1) + event.response_time_ms) / stats["count"]
         stats["max_time"] = max(stats["max_time"], event.response_time_ms)
 
-        now = time.time()
-        self.ip_request_counts[event.source_ip].append(now)
+        now = time.monotonic()
+        times = self.ip_request_times[event.source_ip]
+        times.append(now)
+        cutoff = now - self.rate_window_s
+        while times[0] <= cutoff:
+            times.popleft()
 
     def detect_anomalies(self, event: SecurityEvent) -> List[Dict[str, Any]]:
         anomalies = []
@@ -103,16 +130,21 @@ class AnomalyDetector:
         return anomalies
 
     def _detect_rate_anomaly(self, event: SecurityEvent) -> List[Dict[str, Any]]:
-        now = time.time()
-        recent_requests = [t for t in self.ip_request_counts[event.source_ip] if now - t < 60]
+        count = len(self.ip_request_times.get(event.source_ip, ()))
+        if count <= self.rate_threshold:
+            return []
         
-        if len(recent_requests) > 100:
+        # Keep reporting a sustained flood once per window rather than once per request
+        now = time.monotonic()
+        flagged_at = self.ip_rate_flagged_at.get(event.source_ip)
+        if flagged_at is None or now - flagged_at >= self.rate_window_s:
+            self.ip_rate_flagged_at[event.source_ip] = now
             return [{
                 "type": "rate_limit_violation",
                 "severity": "high",
-                "details": f"IP {event.source_ip} made {len(recent_requests)} requests in 60s (threshold: 100)",
+                "details": f"IP {event.source_ip} made {count} requests in {self.rate_window_s:.0f}s (threshold: {self.rate_threshold})",
                 "indicator": "requests_per_minute",
-                "value": len(recent_requests)
+                "value": count
             }]
         return []
 
@@ -146,18 +178,13 @@ class AnomalyDetector:
         return []
 
     def _detect_suspicious_payload(self, event: SecurityEvent) -> List[Dict[str, Any]]:
-        suspicious_patterns = [
-            ("sql_injection", ["' OR ", "UNION SELECT", "DROP TABLE", "; --"]),
-            ("xss_attempt", ["<script>", "javascript:", "onerror=", "onload="]),
-            ("path_traversal", ["../", "..\\", "%2e%2e"]),
-            ("command_injection", ["; ls", "| cat", "&& whoami", "`id`"]),
-        ]
-
         payload_str = json.dumps(event.metadata).lower()
+        if not _SUSPICIOUS_ANY.search(payload_str):
+            return []
         
-        for attack_type, patterns in suspicious_patterns:
-            for pattern in patterns:
-                if pattern.lower() in payload_str:
+        for (attack_type, patterns), (_, lowered) in zip(SUSPICIOUS_PATTERNS, _SUSPICIOUS_LOWERED):
+            for pattern, needle in zip(patterns, lowered):
+                if needle in payload_str:
                     return [{
                         "type": attack_type,
                         "severity": "critical",
@@ -202,7 +229,50 @@ class SecurityMonitor:
         
         return None
 
-    def _create_threat_detection(self, event: SecurityEvent, anomalies: List[Dict[str, Any]]) -> ThreatDetection:
+    def ingest_events(self, events: List[SecurityEvent]) -> List[ThreatDetection]:
+        """Ingest a batch of events, detecting threats exactly as ingest_event would per event.
+
+        The one difference is the AI analysis. It runs once per (source IP, category)
+        group and is appended only to the description of the group's first threat,
+        labelled with the detection IDs of the other threats it covers. The other
+        threats in the group carry no "AI Analysis" section of their own.
+        """
+        # Detection stays per-event because it depends on the running history
+        add_event = self.anomaly_detector.add_event
+        detect_anomalies = self.anomaly_detector.detect_anomalies
+        self.event_buffer.extend(events)
+        
+        threats: List[ThreatDetection] = []
+        groups: Dict[Tuple[str, str], List[Tuple[SecurityEvent, List[Dict[str, Any]], ThreatDetection]]] = {}
+        for event in events:
+            add_event(event)
+            anomalies = detect_anomalies(event)
+            if anomalies:
+                threat = self._create_threat_detection(event, anomalies, analyze=False)
+                self.threat_detections.append(threat)
+                threats.append(threat)
+                groups.setdefault((event.source_ip, threat.category), []).append((event, anomalies, threat))
+        
+        if self.use_ai and self.client:
+            for (source_ip, category), group in groups.items():
+                event, anomalies, lead = group[0]
+                ai_analysis = self._ai_threat_analysis(event, anomalies)
+                if not ai_analysis:
+                    continue
+                label = "AI Analysis"
+                if len(group) > 1:
+                    related = ", ".join(threat.detection_id for _, _, threat in group[1:])
+                    label = f"AI Analysis (group: {category} from {source_ip}, also covers {related})"
+                lead.description = f"{lead.description}\n\n{label}: {ai_analysis}"
+        
+        if self.incident_manager:
+            for threat in threats:
+                if threat.threat_level in ["critical", "high"]:
+                    self._create_security_incident(threat)
+        
+        return threats
+
+    def _create_threat_detection(self, event: SecurityEvent, anomalies: List[Dict[str, Any]], analyze: bool = True) -> ThreatDetection:
         severity_map = {"critical": 4, "high": 3, "medium": 2, "low": 1, "info": 0}
         max_severity = max((a.get("severity", "low") for a in anomalies), key=lambda s: severity_map.get(s, 0))
         
@@ -222,7 +292,7 @@ class SecurityMonitor:
         
         confidence = self._calculate_confidence(anomalies)
         
-        if self.use_ai and self.client:
+        if analyze and self.use_ai and self.client:
             ai_analysis = self._ai_threat_analysis(event, anomalies)
             if ai_analysis:
                 description = f"{description}\n\nAI Analysis: {ai_analysis}"
@@ -0,0 +1,167 @@
+"""
+Tests for the bulk approval, batched write and batch deployment paths of ChangeManagementSystem
+"""
+import json
+
+import pytest
+
+from change_management import (
+    ChangeManagementSystem,
+    ChangePriority,
+    ChangeStatus,
+    ChangeType,
+)
+
+
+@pytest.fixture
+def cms(tmp_path, monkeypatch):
+    """A change management system storing everything under a temporary directory"""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    return ChangeManagementSystem(storage_dir=str(tmp_path / "change_management"))
+
+
+def _create_change(cms, title):
+    change = cms.create_change_request(
+        title=title,
+        description="Test change",
+        change_type=ChangeType.CONFIGURATION,
+        priority=ChangePriority.LOW,
+        requester="dev@company.com",
+        affected_systems=["api"],
+        business_justification="Testing",
+        technical_details="None"
+    )
+    return change.change_id
+
+
+def _approved_change(cms, title):
+    change_id = _create_change(cms, title)
+    cms.request_approval(change_id, "lead@company.com")
+    assert cms.approve_change(change_id, "lead@company.com")
+    return change_id
+
+
+def _logged_events(cms):
+    log_file = cms.storage_dir / "change_events.log"
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+def _status_on_disk(cms, change_id):
+    change_file = cms.changes_dir / f"{change_id}.json"
+    return json.loads(change_file.read_text())["status"]
+
+
+def test_bulk_request_approval_records_every_approver(cms):
+    """Several requests for one change land in a single record with every approver"""
+    change_id = _create_change(cms, "Multi approver change")
+
+    requests = cms.bulk_request_approval([
+        (change_id, "lead@company.com", "please review"),
+        (change_id, "security@company.com", ""),
+    ])
+
+    assert [r["approver"] for r in requests] == ["lead@company.com", "security@company.com"]
+    stored = cms._load_change(change_id)
+    assert stored.status == ChangeStatus.PENDING_APPROVAL.value
+    assert [a["approver"] for a in stored.approvals] == ["lead@company.com", "security@company.com"]
+    events = [e["event_type"] for e in _logged_events(cms) if e["change_id"] == change_id]
+    assert events.count("approval_requested") == 2
+
+
+def test_bulk_decide_applies_decisions(cms):
+    """Approvals and rejections are recorded per change"""
+    first = _create_change(cms, "First change")
+    second = _create_change(cms, "Second change")
+    cms.bulk_request_approval([
+        (first, "lead@company.com", ""),
+        (second, "lead@company.com", ""),
+    ])
+
+    results = cms.bulk_decide([
+        (first, "lead@company.com", "approve", "ok"),
+        (second, "lead@company.com", "reject", "too risky"),
+    ])
+
+    assert results == [True, True]
+    assert _status_on_disk(cms, first) == ChangeStatus.APPROVED.value
+    assert _status_on_disk(cms, second) == ChangeStatus.REJECTED.value
+
+
+def test_bulk_decide_unknown_approver_returns_false(cms):
+    """A decision from someone with no pending approval is not applied"""
+    change_id = _create_change(cms, "Unknown approver change")
+    cms.request_approval(change_id, "lead@company.com")
+    events_before = _logged_events(cms)
+
+    results = cms.bulk_decide([(change_id, "stranger@company.com", "approve", "")])
+
+    assert results == [False]
+    assert _status_on_disk(cms, change_id) == ChangeStatus.PENDING_APPROVAL.value
+    assert _logged_events(cms) == events_before
+
+
+def test_bulk_decide_rejects_unknown_decision(cms):
+    """Only "approve" and "reject" are accepted"""
+    change_id = _create_change(cms, "Bad decision change")
+
+    with pytest.raises(ValueError):
+        cms.bulk_decide([(change_id, "lead@company.com", "maybe", "")])
+
+
+def test_batch_writes_flushes_on_exit(cms):
+    """Change records and log lines are buffered inside the block and written when it ends"""
+    change_id = _approved_change(cms, "Buffered change")
+    events_before = _logged_events(cms)
+
+    with cms.batch_writes():
+        cms.deploy_change(change_id, "ops@company.com")
+        assert cms._load_change(change_id).status == ChangeStatus.IN_PROGRESS.value
+        assert _status_on_disk(cms, change_id) == ChangeStatus.APPROVED.value
+        assert _logged_events(cms) == events_before
+
+    assert _status_on_disk(cms, change_id) == ChangeStatus.IN_PROGRESS.value
+    assert _logged_events(cms)[-1]["event_type"] == "deployment_started"
+
+
+def test_batch_writes_flushes_when_block_raises(cms):
+    """Buffered writes are not lost if the block exits with an exception"""
+    change_id = _approved_change(cms, "Failing batch change")
+
+    with pytest.raises(RuntimeError):
+        with cms.batch_writes():
+            cms.deploy_change(change_id, "ops@company.com")
+            raise RuntimeError("boom")
+
+    assert _status_on_disk(cms, change_id) == ChangeStatus.IN_PROGRESS.value
+    assert _logged_events(cms)[-1]["event_type"] == "deployment_started"
+
+
+def test_deploy_batch_writes_every_change_and_event(cms):
+    """Each change in the batch ends up deployed on disk with its events logged"""
+    change_ids = [_approved_change(cms, f"Batch change {i}") for i in range(3)]
+
+    records = cms.deploy_batch(change_ids, "ops@company.com", notes="done")
+
+    assert len(records) == 3
+    for change_id in change_ids:
+        assert _status_on_disk(cms, change_id) == ChangeStatus.DEPLOYED.value
+        deployment = cms._load_change(change_id).deployment_log[-1]
+        assert deployment["status"] == "completed"
+        assert deployment["notes"] == "done"
+
+    batch_events = [e for e in _logged_events(cms) if e["change_id"] in change_ids]
+    for change_id in change_ids:
+        types = [e["event_type"] for e in batch_events if e["change_id"] == change_id]
+        assert types[-2:] == ["deployment_started", "deployed"]
+
+
+def test_deploy_batch_stops_at_unapproved_change(cms):
+    """An unapproved change raises, and the changes before it are still written"""
+    approved = _approved_change(cms, "Approved batch change")
+    draft = _create_change(cms, "Draft batch change")
+
+    with pytest.raises(ValueError):
+        cms.deploy_batch([approved, draft], "ops@company.com")
+
+    assert _status_on_disk(cms, approved) == ChangeStatus.DEPLOYED.value
+    assert _status_on_disk(cms, draft) == ChangeStatus.DRAFT.value
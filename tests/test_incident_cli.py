@@ -0,0 +1,84 @@
+"""
+Tests for the interactive report command of the incident CLI
+"""
+import pytest
+
+import incident_cli
+from incident_management import IncidentManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """An incident manager without AI that stores incidents in a temporary directory"""
+    manager = IncidentManager(use_ai=False)
+    manager.incidents_dir = tmp_path
+    return manager
+
+
+def _answer(monkeypatch, confirms, prompts, texts):
+    """Feed scripted answers to the CLI prompts; an exception instance is raised instead of returned"""
+    def scripted(answers):
+        def ask(*args, **kwargs):
+            answer = answers.pop(0)
+            if isinstance(answer, BaseException):
+                raise answer
+            return answer
+        return ask
+
+    monkeypatch.setattr(incident_cli.Confirm, "ask", scripted(confirms))
+    monkeypatch.setattr(incident_cli.Prompt, "ask", scripted(prompts))
+    monkeypatch.setattr(incident_cli, "read_multiline", scripted(texts))
+
+
+def _incident(manager):
+    return manager.create_incident(
+        title="Test incident",
+        description="Test description",
+        ai_system_id="sys-001",
+        ai_system_name="Test System",
+        member_state="DE"
+    )
+
+
+def _reload(manager, incident_id):
+    fresh = IncidentManager(use_ai=False)
+    fresh.incidents_dir = manager.incidents_dir
+    return fresh.load_incident(incident_id)
+
+
+def test_report_with_notification(manager, monkeypatch):
+    """Report and notification are both saved"""
+    incident = _incident(manager)
+    _answer(
+        monkeypatch,
+        confirms=[True, True],
+        prompts=["complete", "authority@example.eu"],
+        texts=["Full report", "Notification body"]
+    )
+
+    incident_cli.cmd_report(manager, incident.id)
+
+    stored = _reload(manager, incident.id)
+    assert stored.complete_report_submitted
+    assert stored.authority_notified
+    assert stored.authority_contact == "authority@example.eu"
+
+
+@pytest.mark.parametrize("interrupt", [KeyboardInterrupt(), EOFError()])
+def test_report_survives_interrupted_notification_prompt(manager, monkeypatch, interrupt):
+    """A report already typed in is saved even if the notification prompt is aborted"""
+    incident = _incident(manager)
+    _answer(
+        monkeypatch,
+        confirms=[True, interrupt],
+        prompts=["complete"],
+        texts=["Full report"]
+    )
+
+    with pytest.raises(type(interrupt)):
+        incident_cli.cmd_report(manager, incident.id)
+
+    stored = _reload(manager, incident.id)
+    assert stored.complete_report_submitted
+    assert not stored.authority_notified
+    assert (manager.incidents_dir / f"{incident.id}_report.txt").read_text(encoding="utf-8") == "Full report"
@@ -0,0 +1,240 @@
+"""
+Tests for incident loading/caching, the AI response cache and the batched report/notification path of IncidentManager
+"""
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import incident_management
+from incident_management import IncidentManager, IncidentSeverity, IncidentStatus
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """An incident manager without AI that stores incidents in a temporary directory"""
+    manager = IncidentManager(use_ai=False)
+    manager.incidents_dir = tmp_path
+    return manager
+
+
+def _create_incident(manager, title="Test incident"):
+    return manager.create_incident(
+        title=title,
+        description="Test description",
+        ai_system_id="sys-001",
+        ai_system_name="Test System",
+        member_state="DE"
+    )
+
+
+def _reload(manager, incident_id):
+    """Read an incident back through a fresh manager so nothing comes from memory"""
+    fresh = IncidentManager(use_ai=False)
+    fresh.incidents_dir = manager.incidents_dir
+    return fresh.load_incident(incident_id)
+
+
+def test_submit_batch_applies_all_operations(manager):
+    """Every operation's state and text files are on disk after the batch"""
+    incident = _create_incident(manager)
+
+    manager.submit_batch([
+        ("initial", incident, "Initial findings"),
+        ("notify", incident, "authority@example.eu", "Notification body"),
+        ("complete", incident, "Full report"),
+    ])
+
+    stored = _reload(manager, incident.id)
+    assert stored.initial_report_submitted
+    assert stored.complete_report_submitted
+    assert stored.authority_notified
+    assert stored.authority_contact == "authority@example.eu"
+    assert stored.status == IncidentStatus.REPORTED
+    assert (manager.incidents_dir / f"{incident.id}_report.txt").read_text(encoding="utf-8") == "Full report"
+    assert (manager.incidents_dir / f"{incident.id}_authority_notification.txt").read_text(encoding="utf-8") == "Notification body"
+
+
+def test_submit_batch_saves_each_incident_once(manager, monkeypatch):
+    """Several operations on one incident produce a single JSON write"""
+    incident = _create_incident(manager)
+    written = []
+    original_save = IncidentManager.save_incident
+
+    def counting_save(self, inc):
+        if self._pending_incidents is None:
+            written.append(inc.id)
+        original_save(self, inc)
+
+    monkeypatch.setattr(IncidentManager, "save_incident", counting_save)
+
+    manager.submit_batch([
+        ("initial", incident, "Initial findings"),
+        ("notify", incident, "authority@example.eu", "Notification body"),
+    ])
+
+    assert written == [incident.id]
+
+
+def test_batch_writes_flushes_on_exit(manager):
+    """Incident JSON is buffered inside the block and written when it ends"""
+    incident = _create_incident(manager)
+
+    with manager.batch_writes():
+        manager.submit_initial_report(incident, "Initial findings")
+        assert manager.load_incident(incident.id).initial_report_submitted
+        assert not _reload(manager, incident.id).initial_report_submitted
+
+    assert _reload(manager, incident.id).initial_report_submitted
+
+
+def test_batch_writes_flushes_when_block_raises(manager):
+    """Buffered incidents are still written if the block exits with an exception"""
+    incident = _create_incident(manager)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch_writes():
+            manager.submit_initial_report(incident, "Initial findings")
+            raise RuntimeError("boom")
+
+    assert _reload(manager, incident.id).initial_report_submitted
+
+
+def test_load_picks_up_external_rewrite_with_same_mtime(manager):
+    """An outside edit is noticed even if the file's mtime did not move (coarse timestamps)"""
+    incident = _create_incident(manager)
+    assert manager.load_incident(incident.id).title == "Test incident"
+
+    incident_file = manager.incidents_dir / f"{incident.id}.json"
+    st = incident_file.stat()
+    data = json.loads(incident_file.read_text(encoding="utf-8"))
+    data["title"] = "Edited outside the manager"
+    incident_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.utime(incident_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert manager.load_incident(incident.id).title == "Edited outside the manager"
+
+
+def test_loaded_incidents_are_independent_copies(manager):
+    """Changing a loaded incident without saving does not leak into later loads"""
+    incident = _create_incident(manager)
+    incident.investigation_notes.append("added after save, never saved")
+
+    loaded = manager.load_incident(incident.id)
+    loaded.title = "Changed in memory"
+    loaded.investigation_notes.append("unsaved note")
+    loaded.metadata["unsaved"] = True
+
+    again = manager.load_incident(incident.id)
+    assert again is not loaded
+    assert again.title == "Test incident"
+    assert again.investigation_notes == []
+    assert again.metadata == {}
+
+
+def test_saved_changes_are_returned_by_later_loads(manager):
+    """Saving a modified copy updates what the cache serves"""
+    incident = _create_incident(manager)
+
+    loaded = manager.load_incident(incident.id)
+    loaded.investigation_notes.append("saved note")
+    manager.save_incident(loaded)
+
+    assert manager.load_incident(incident.id).investigation_notes == ["saved note"]
+
+
+class _StubModels:
+    """Stands in for client.models and records every prompt it is asked about"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.prompts = []
+
+    def generate_content(self, model, contents, config=None):
+        self.prompts.append(contents)
+        kind = "sev" if "Classify" in contents else "rem"
+        return SimpleNamespace(text=self.responses[kind])
+
+
+CLASSIFICATION = '{"severity": "high", "incident_type": "c", "is_serious": true, "reasoning": "stub"}'
+REMEDIATION = '["Roll back the model", "Notify users"]'
+
+
+@pytest.fixture
+def stub_models():
+    return _StubModels({"sev": CLASSIFICATION, "rem": REMEDIATION})
+
+
+@pytest.fixture
+def ai_manager(manager, stub_models, tmp_path, monkeypatch):
+    """An incident manager wired to the stub model, with the AI cache in a temporary directory"""
+    monkeypatch.setattr(incident_management, "AI_CACHE_DIR", tmp_path / "ai_cache")
+    monkeypatch.setattr(
+        incident_management, "types",
+        SimpleNamespace(GenerateContentConfig=lambda **kwargs: kwargs),
+        raising=False
+    )
+    manager.use_ai = True
+    manager.client = SimpleNamespace(models=stub_models)
+    return manager
+
+
+def test_identical_prompts_hit_the_ai_cache(ai_manager, stub_models):
+    """Classifying and suggesting for identical incidents calls the model once per kind"""
+    first = _create_incident(ai_manager, title="Same incident")
+    second = _create_incident(ai_manager, title="Same incident")
+
+    assert first.severity == second.severity == IncidentSeverity.HIGH
+    assert ai_manager.suggest_remediation(first) == ["Roll back the model", "Notify users"]
+    assert ai_manager.suggest_remediation(second) == ["Roll back the model", "Notify users"]
+    assert len(stub_models.prompts) == 2
+
+
+def test_different_prompts_miss_the_ai_cache(ai_manager, stub_models):
+    """A change in the incident text changes the prompt hash, so the model is asked again"""
+    _create_incident(ai_manager, title="First incident")
+    _create_incident(ai_manager, title="Second incident")
+
+    assert len(stub_models.prompts) == 2
+
+
+def test_corrupt_ai_cache_file_is_replaced(ai_manager, stub_models):
+    """An unparsable cache entry is ignored, the model is called, and the entry is rewritten"""
+    incident = _create_incident(ai_manager)
+    cache_files = list(incident_management.AI_CACHE_DIR.glob("sev-*.json"))
+    assert len(cache_files) == 1
+    cache_files[0].write_text("{truncated")
+
+    ai_manager.classify_severity(incident)
+
+    assert len(stub_models.prompts) == 2
+    assert json.loads(cache_files[0].read_text())["severity"] == "high"
+
+
+def test_unreadable_ai_cache_entry_falls_back_to_the_model(ai_manager, stub_models):
+    """A cache path that cannot be read or written never breaks the AI call"""
+    incident = _create_incident(ai_manager)
+    prompt = stub_models.prompts[0]
+    cache_path = ai_manager._ai_cache_path("sev", prompt)
+    cache_path.unlink()
+    cache_path.mkdir()
+
+    ai_manager.classify_severity(incident)
+    ai_manager.classify_severity(incident)
+
+    assert incident.severity == IncidentSeverity.HIGH
+    assert len(stub_models.prompts) == 3
+
+
+def test_failed_ai_response_is_not_cached(ai_manager, stub_models):
+    """An unusable model answer falls back to the defaults and is retried next time"""
+    stub_models.responses["rem"] = "not json"
+    incident = _create_incident(ai_manager)
+
+    fallback = ai_manager.suggest_remediation(incident)
+    assert "Conduct root cause analysis" in fallback
+    assert not list(incident_management.AI_CACHE_DIR.glob("rem-*.json"))
+
+    stub_models.responses["rem"] = REMEDIATION
+    assert ai_manager.suggest_remediation(incident) == ["Roll back the model", "Notify users"]
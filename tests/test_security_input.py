@@ -0,0 +1,90 @@
+"""
+Tests for the token-bucket InMemoryRateLimiter
+"""
+import pytest
+
+from security_input import InMemoryRateLimiter, RateLimitConfig
+
+SECOND = 1_000_000_000
+
+
+@pytest.fixture(params=[True, False], ids=["locked", "unlocked"])
+def limiter(request):
+    """Two requests per 10 seconds, i.e. one token every 5 seconds"""
+    return InMemoryRateLimiter(RateLimitConfig(requests=2, per_seconds=10), thread_safe=request.param)
+
+
+def test_bucket_starts_full_then_denies(limiter):
+    """A new key gets the full burst, then is refused"""
+    assert limiter.allow("ip", now_ns=0)
+    assert limiter.allow("ip", now_ns=0)
+    assert not limiter.allow("ip", now_ns=0)
+
+
+def test_refill_is_proportional_to_elapsed_time(limiter):
+    """Tokens come back at requests/per_seconds, not all at once"""
+    assert limiter.allow("ip", now_ns=0)
+    assert limiter.allow("ip", now_ns=0)
+
+    assert not limiter.allow("ip", now_ns=49 * SECOND // 10)
+    assert limiter.allow("ip", now_ns=5 * SECOND)
+    assert not limiter.allow("ip", now_ns=5 * SECOND)
+
+
+def test_refill_is_capped_at_capacity(limiter):
+    """A long idle period refills the bucket only up to `requests` tokens"""
+    assert limiter.allow("ip", now_ns=0)
+    assert limiter.allow("ip", now_ns=0)
+
+    allowed = sum(limiter.allow("ip", now_ns=1000 * SECOND) for _ in range(10))
+    assert allowed == 2
+
+
+def test_keys_have_separate_buckets(limiter):
+    """Draining one key leaves the others untouched"""
+    assert limiter.allow("a", now_ns=0)
+    assert limiter.allow("a", now_ns=0)
+    assert not limiter.allow("a", now_ns=0)
+    assert limiter.allow("b", now_ns=0)
+
+
+def test_allow_batch_grants_only_available_tokens(limiter):
+    """allow_batch returns how many of the n requests fit in the bucket"""
+    assert limiter.allow_batch("ip", 1, now_ns=0) == 1
+    assert limiter.allow_batch("ip", 5, now_ns=0) == 1
+    assert limiter.allow_batch("ip", 5, now_ns=0) == 0
+
+
+def test_allow_batch_ignores_non_positive_counts(limiter):
+    """Zero or negative batch sizes consume nothing"""
+    assert limiter.allow_batch("ip", 0, now_ns=0) == 0
+    assert limiter.allow_batch("ip", -3, now_ns=0) == 0
+    assert limiter.allow_batch("ip", 2, now_ns=0) == 2
+
+
+def test_allow_batch_matches_repeated_allow():
+    """A batch has the same outcome as the same number of allow() calls"""
+    config = RateLimitConfig(requests=5, per_seconds=1)
+    batched = InMemoryRateLimiter(config)
+    single = InMemoryRateLimiter(config)
+
+    for now_ns, n in [(0, 3), (SECOND // 10, 4), (SECOND // 2, 6), (3 * SECOND, 2)]:
+        expected = sum(single.allow("ip", now_ns=now_ns) for _ in range(n))
+        assert batched.allow_batch("ip", n, now_ns=now_ns) == expected
+
+
+def test_default_clock_is_monotonic(limiter, monkeypatch):
+    """Without now_ns the limiter reads time.monotonic_ns(), so explicit and implicit times mix"""
+    monkeypatch.setattr("security_input.time.monotonic_ns", lambda: 0)
+    assert limiter.allow_batch("ip", 2) == 2
+
+    assert not limiter.allow("ip", now_ns=49 * SECOND // 10)
+    assert limiter.allow("ip", now_ns=5 * SECOND)
+
+
+def test_allow_methods_are_defined_on_the_class(monkeypatch):
+    """allow/allow_batch are real methods, so class-level patching reaches every instance"""
+    monkeypatch.setattr(InMemoryRateLimiter, "allow", lambda self, key, now_ns=None: False)
+
+    assert not InMemoryRateLimiter().allow("ip")
+    assert not InMemoryRateLimiter(thread_safe=False).allow("ip")
@@ -0,0 +1,188 @@
+"""
+Tests for rate-limit detection and bulk ingestion in security_monitoring
+"""
+from datetime import datetime
+
+import pytest
+
+import security_monitoring as sm
+
+
+class _Clock:
+    """Stands in for the time module so the sliding window can be stepped manually"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(sm, "time", clock)
+    return clock
+
+
+def _event(i, source_ip="10.0.0.1", metadata=None, status_code=200):
+    return sm.SecurityEvent(
+        event_id=f"evt-{i}",
+        timestamp=datetime.now().isoformat(),
+        category="api_request",
+        source_ip=source_ip,
+        user_agent="pytest",
+        endpoint="/api/predict",
+        method="POST",
+        status_code=status_code,
+        response_time_ms=20.0,
+        payload_size_bytes=128,
+        metadata=metadata or {}
+    )
+
+
+def _rate_flags(detector, events):
+    """Feed events one by one and return the indices that raised a rate violation"""
+    flagged = []
+    for i, event in enumerate(events):
+        detector.add_event(event)
+        if any(a["type"] == "rate_limit_violation" for a in detector.detect_anomalies(event)):
+            flagged.append(i)
+    return flagged
+
+
+def test_rate_rule_fires_just_past_threshold(clock):
+    """The request that takes an IP over the threshold inside the window is flagged"""
+    detector = sm.AnomalyDetector()
+    events = [_event(i) for i in range(detector.rate_threshold + 1)]
+
+    assert _rate_flags(detector, events) == [detector.rate_threshold]
+
+
+def test_rate_rule_does_not_fire_when_spread_over_windows(clock):
+    """The same number of requests spread past the window length is not a violation"""
+    detector = sm.AnomalyDetector()
+    # Slightly slower than threshold-per-window, so the window never holds more than the threshold
+    step = detector.rate_window_s / detector.rate_threshold * 1.01
+
+    flagged = []
+    for i in range(detector.rate_threshold * 3):
+        clock.now += step
+        flagged += [i] if _rate_flags(detector, [_event(i)]) else []
+
+    assert flagged == []
+
+
+def test_rate_rule_fires_once_per_window(clock):
+    """A sustained flood is reported once per window, not once per request"""
+    detector = sm.AnomalyDetector()
+    threshold = detector.rate_threshold
+
+    first = _rate_flags(detector, [_event(i) for i in range(threshold * 2)])
+    clock.now += detector.rate_window_s - 1
+    same_window = _rate_flags(detector, [_event(i) for i in range(threshold)])
+
+    assert first == [threshold]
+    assert same_window == []
+
+
+def test_rate_rule_fires_again_after_window_expires(clock):
+    """Once the window has passed, a new flood from the same IP is reported again"""
+    detector = sm.AnomalyDetector()
+    threshold = detector.rate_threshold
+
+    assert _rate_flags(detector, [_event(i) for i in range(threshold + 1)]) == [threshold]
+    clock.now += detector.rate_window_s + 1
+    assert _rate_flags(detector, [_event(i) for i in range(threshold + 1)]) == [threshold]
+
+
+def test_rate_rule_is_per_source_ip(clock):
+    """Flooding from one IP does not flag another"""
+    detector = sm.AnomalyDetector()
+    threshold = detector.rate_threshold
+
+    assert _rate_flags(detector, [_event(i) for i in range(threshold + 1)]) == [threshold]
+    assert _rate_flags(detector, [_event(i, source_ip="10.0.0.2") for i in range(threshold)]) == []
+
+
+def _monitor_with_stub_ai(monkeypatch):
+    """A monitor whose AI analysis is a local stub that records each call"""
+    monitor = sm.SecurityMonitor(use_ai=False)
+    monitor.use_ai = True
+    monitor.client = object()
+    calls = []
+
+    def analyse(event, anomalies):
+        calls.append(event.event_id)
+        return f"analysis of {event.event_id}"
+
+    monkeypatch.setattr(monitor, "_ai_threat_analysis", analyse)
+    return monitor, calls
+
+
+def _mixed_events():
+    sqli = {"query": "SELECT * FROM users WHERE id = '1' OR '1'='1'"}
+    xss = {"comment": "<script>alert(1)</script>"}
+    return [
+        _event(0, metadata=sqli),
+        _event(1),
+        _event(2, metadata=sqli),
+        _event(3, source_ip="10.0.0.2", metadata=sqli),
+        _event(4, metadata=xss),
+        _event(5, metadata=sqli),
+    ]
+
+
+def _without_ai(threat):
+    return {
+        "threat_level": threat.threat_level,
+        "category": threat.category,
+        "title": threat.title,
+        "description": threat.description.split("\n\nAI Analysis")[0],
+        "affected_events": threat.affected_events,
+        "indicators": threat.indicators,
+        "confidence_score": threat.confidence_score,
+        "recommended_actions": sorted(threat.recommended_actions),
+        "eu_ai_act_article": threat.eu_ai_act_article,
+    }
+
+
+def test_ingest_events_matches_per_event_ingestion(monkeypatch):
+    """Bulk ingestion detects the same threats as calling ingest_event for each event"""
+    single, _ = _monitor_with_stub_ai(monkeypatch)
+    bulk, _ = _monitor_with_stub_ai(monkeypatch)
+    events = _mixed_events()
+
+    expected = [t for t in (single.ingest_event(e) for e in events) if t is not None]
+    threats = bulk.ingest_events(events)
+
+    assert [_without_ai(t) for t in threats] == [_without_ai(t) for t in expected]
+    assert bulk.threat_detections == threats
+    assert bulk.event_buffer == events
+
+
+def test_ingest_events_attaches_group_analysis_to_first_threat_only(monkeypatch):
+    """One AI call per (IP, category) group, shown on the group's first threat and labelled as shared"""
+    single, single_calls = _monitor_with_stub_ai(monkeypatch)
+    bulk, bulk_calls = _monitor_with_stub_ai(monkeypatch)
+    events = _mixed_events()
+
+    for event in events:
+        single.ingest_event(event)
+    threats = {t.affected_events[0]: t for t in bulk.ingest_events(events)}
+
+    # Per-event ingestion analyses every threat; bulk ingestion once per group
+    assert single_calls == ["evt-0", "evt-2", "evt-3", "evt-4", "evt-5"]
+    assert bulk_calls == ["evt-0", "evt-3", "evt-4"]
+
+    lead = threats["evt-0"]
+    followers = [threats["evt-2"], threats["evt-5"]]
+    covered = ", ".join(t.detection_id for t in followers)
+    assert lead.description.endswith(
+        f"AI Analysis (group: sql_injection from 10.0.0.1, also covers {covered}): analysis of evt-0"
+    )
+    assert all("AI Analysis" not in t.description for t in followers)
+
+    # Single-threat groups get a plain, unlabelled analysis
+    assert threats["evt-3"].description.endswith("\n\nAI Analysis: analysis of evt-3")
+    assert threats["evt-4"].description.endswith("\n\nAI Analysis: analysis of evt-4")